@@ -0,0 +1,53 @@
+"""Maintenance commands: python -m app.cli <command>"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from app.dependencies.db import async_session_maker, engine
+from app.dependencies.idempotency import purge_idempotency_keys
+from app.dependencies.job_dependency import TOMBSTONE_RETENTION_DAYS, purge_tombstones
+from app.dependencies.job_stats import rebuild_job_stats
+
+
+async def rebuild_job_stats_command() -> None:
+    async with async_session_maker() as session:
+        users = await rebuild_job_stats(session)
+    print(f"Rebuilt job stats for {users} users")
+
+
+async def purge_tombstones_command() -> None:
+    cutoff = datetime.utcnow() - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+    async with async_session_maker() as session:
+        purged = await purge_tombstones(session, cutoff)
+    print(f"Purged {purged} job tombstones older than {TOMBSTONE_RETENTION_DAYS} days")
+
+
+async def purge_idempotency_keys_command() -> None:
+    async with async_session_maker() as session:
+        purged = await purge_idempotency_keys(session, datetime.utcnow())
+    print(f"Purged {purged} expired idempotency keys")
+
+
+COMMANDS = {
+    "rebuild-job-stats": rebuild_job_stats_command,
+    "purge-tombstones": purge_tombstones_command,
+    "purge-idempotency-keys": purge_idempotency_keys_command,
+}
+
+
+async def run(command: str) -> None:
+    try:
+        await COMMANDS[command]()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+    asyncio.run(run(args.command))
+
+
+if __name__ == "__main__":
+    main()
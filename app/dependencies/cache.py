@@ -0,0 +1,186 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Iterable
+from dotenv import load_dotenv
+import os
+import time
+
+load_dotenv()
+
+JOB_CACHE_ENABLED = os.getenv("JOB_CACHE_ENABLED", "true").lower() == "true"
+JOB_CACHE_MAXSIZE = int(os.getenv("JOB_CACHE_MAXSIZE", 1024))
+JOB_CACHE_TTL_SECONDS = float(os.getenv("JOB_CACHE_TTL_SECONDS", 30))
+TOKEN_CACHE_ENABLED = os.getenv("TOKEN_CACHE_ENABLED", "true").lower() == "true"
+TOKEN_CACHE_MAXSIZE = int(os.getenv("TOKEN_CACHE_MAXSIZE", 4096))
+PROFILE_CACHE_MAXSIZE = int(os.getenv("PROFILE_CACHE_MAXSIZE", 1024))
+PROFILE_CACHE_TTL_SECONDS = float(os.getenv("PROFILE_CACHE_TTL_SECONDS", 300))
+
+
+class CacheBackend(ABC):
+    """Interface for response caches. `None` values are never cached."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    async def set(
+        self, key: str, value: Any, ttl: float | None = None, tags: Iterable[str] = ()
+    ) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def invalidate_tag(self, tag: str) -> None:
+        """Drop every entry stored with `tag`."""
+
+    @abstractmethod
+    async def version(self) -> int:
+        """Counter that changes on every invalidation."""
+
+    @abstractmethod
+    def stats(self) -> dict: ...
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """Read-through lookup.
+
+        A value loaded while an invalidation happened is returned but not
+        stored, so a slow reader cannot put pre-write data back in the cache.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+        version = await self.version()
+        value = await loader()
+        if value is not None and await self.version() == version:
+            await self.set(key, value, ttl=ttl, tags=tags)
+        return value
+
+
+class NullCache(CacheBackend):
+    """Backend used when caching is disabled."""
+
+    async def get(self, key: str) -> Any | None:
+        return None
+
+    async def set(self, key, value, ttl=None, tags=()) -> None:
+        pass
+
+    async def delete(self, key: str) -> None:
+        pass
+
+    async def invalidate_tag(self, tag: str) -> None:
+        pass
+
+    async def version(self) -> int:
+        return 0
+
+    def stats(self) -> dict:
+        return {"enabled": False}
+
+
+class LRUCache(CacheBackend):
+    """In-process LRU cache with a per-entry TTL and a size bound."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expires_at, value, tags)
+        self._entries: OrderedDict[str, tuple[float, Any, tuple[str, ...]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _remove(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    async def set(self, key, value, ttl=None, tags=()) -> None:
+        if key in self._entries:
+            self._remove(key)
+        tags = tuple(tags)
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._version += 1
+        if key in self._entries:
+            self._remove(key)
+            self.invalidations += 1
+
+    async def invalidate_tag(self, tag: str) -> None:
+        self._version += 1
+        for key in list(self._tags.get(tag, ())):
+            self._remove(key)
+            self.invalidations += 1
+
+    async def version(self) -> int:
+        return self._version
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": True,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+job_cache: CacheBackend = (
+    LRUCache(maxsize=JOB_CACHE_MAXSIZE, ttl=JOB_CACHE_TTL_SECONDS)
+    if JOB_CACHE_ENABLED
+    else NullCache()
+)
+
+# verified JWT claims; entries carry their own TTL up to the token's `exp`
+token_cache: CacheBackend = (
+    LRUCache(maxsize=TOKEN_CACHE_MAXSIZE, ttl=0)
+    if TOKEN_CACHE_ENABLED
+    else NullCache()
+)
+
+# public user profiles, keyed by username; only used when PROFILE_FROM_TOKEN is on
+profile_cache: CacheBackend = LRUCache(
+    maxsize=PROFILE_CACHE_MAXSIZE, ttl=PROFILE_CACHE_TTL_SECONDS
+)
@@ -1,26 +1,134 @@
-from sqlmodel import SQLModel
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from pathlib import Path
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from typing import AsyncGenerator
 from dotenv import load_dotenv
 import os
+import time
 
 load_dotenv()
 
 DATABASE_URL = os.getenv('POSTGRES_CONN_STR')
+# optional read replica for public reads; falls back to the primary
+REPLICA_URL = os.getenv("POSTGRES_REPLICA_CONN_STR")
+ALEMBIC_CONFIG = Path(__file__).resolve().parents[2] / "alembic.ini"
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=True  # optional: shows SQL statements
-)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# asyncpg prepared statement cache, per connection
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 256))
+# after a write, that client's reads go to the primary for this long (0 disables)
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", 0))
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+
+def engine_options(url: str) -> dict:
+    options = {
+        "echo": DB_ECHO,
+        "poolclass": TimedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    if make_url(url).get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE
+        }
+    return options
+
+
+engine = create_async_engine(DATABASE_URL, **engine_options(DATABASE_URL))
 
 async_session_maker = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
-async def create_db_and_tables():
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+read_engine = (
+    create_async_engine(REPLICA_URL, **engine_options(REPLICA_URL))
+    if REPLICA_URL
+    else engine
+)
+
+read_session_maker = sessionmaker(
+    read_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+def read_session_for(primary: bool) -> AsyncSession:
+    """Session on the replica, or on the primary for a client that has just written.
+
+    Primary sessions are flagged in `session.info["primary"]` so callers can
+    skip caches that may have been refilled from a lagging replica.
+    """
+    if primary:
+        session = async_session_maker()
+        session.info["primary"] = True
+        return session
+    return read_session_maker()
+
+
+def expected_schema_version() -> str | None:
+    """Head revision of the migrations shipped with this code."""
+    return ScriptDirectory.from_config(Config(str(ALEMBIC_CONFIG))).get_current_head()
+
+
+async def check_schema_version():
+    """Fail fast unless the database has been migrated to the expected revision."""
+    expected = expected_schema_version()
+    async with engine.connect() as conn:
+        try:
+            current = (
+                await conn.execute(text("SELECT version_num FROM alembic_version"))
+            ).scalar()
+        except DBAPIError:
+            current = None
+    if current != expected:
+        raise RuntimeError(
+            f"Database schema is at revision {current}, expected {expected}. "
+            "Run `alembic upgrade head`."
+        )
+
+def pool_stats(pool: TimedQueuePool) -> dict:
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "checkouts": pool.checkouts,
+        "avg_wait_seconds": pool.wait_seconds / pool.checkouts if pool.checkouts else 0.0,
+        "max_wait_seconds": pool.max_wait_seconds,
+    }
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
@@ -0,0 +1,30 @@
+from fastapi import HTTPException, Request, Response, status
+import hashlib
+
+
+def weak_etag(*parts) -> str:
+    """Build a weak validator from the values that identify a representation."""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of `etag` against an If-None-Match header."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def check_etag(request: Request, response: Response, etag: str) -> None:
+    """Answer 304 when the client already holds `etag`, otherwise advertise it."""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
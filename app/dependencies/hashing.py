@@ -0,0 +1,95 @@
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException, status
+from pwdlib import PasswordHash
+from dotenv import load_dotenv
+import asyncio
+import os
+import threading
+import time
+
+load_dotenv()
+
+HASH_POOL_SIZE = int(os.getenv("HASH_POOL_SIZE", min(4, os.cpu_count() or 1)))
+HASH_QUEUE_SIZE = int(os.getenv("HASH_QUEUE_SIZE", 32))
+
+password_hash = PasswordHash.recommended()
+
+
+class HashingPool:
+    """Bounded thread pool for argon2 work.
+
+    argon2 releases the GIL while hashing, so threads run in parallel and the
+    event loop stays free. Once `workers + queue_size` calls are in flight,
+    new calls fail fast with 503 instead of queueing without limit.
+    """
+
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.queue_size = queue_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="argon2"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def _timed(self, fn, *args):
+        with self._lock:
+            self._running += 1
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._running -= 1
+                self.completed += 1
+                self.total_seconds += elapsed
+                self.max_seconds = max(self.max_seconds, elapsed)
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, fn, *args):
+        with self._lock:
+            if self._pending >= self.workers + self.queue_size:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Server is busy, please retry",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+        # released when the work finishes, even if the caller was cancelled
+        future = self._executor.submit(self._timed, fn, *args)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "running": self._running,
+                "queue_depth": self._pending - self._running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_seconds": self.total_seconds / self.completed if self.completed else 0.0,
+                "max_seconds": self.max_seconds,
+            }
+
+
+hashing_pool = HashingPool(workers=HASH_POOL_SIZE, queue_size=HASH_QUEUE_SIZE)
+
+
+async def hash_password(password: str) -> str:
+    return await hashing_pool.run(password_hash.hash, password)
+
+
+async def verify_password(password: str, hashed_password: str) -> bool:
+    return await hashing_pool.run(password_hash.verify, password, hashed_password)
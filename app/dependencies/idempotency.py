@@ -0,0 +1,292 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Annotated, Any, Awaitable, Callable, NamedTuple
+from fastapi import Header, HTTPException, Response, status
+from pydantic import BaseModel
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.dependencies.cache import LRUCache
+from app.dependencies.db import async_session_maker
+from app.dependencies.serialization import dump_json
+from app.models.idempotency_model import IdempotencyKey
+from dotenv import load_dotenv
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import time
+
+load_dotenv()
+
+# "memory" keeps keys per worker; "database" shares them through idempotency_keys
+IDEMPOTENCY_BACKEND = os.getenv("IDEMPOTENCY_BACKEND", "memory").lower()
+IDEMPOTENCY_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", 86400))
+IDEMPOTENCY_MAXSIZE = int(os.getenv("IDEMPOTENCY_MAXSIZE", 10000))
+# a claim not completed within this long is treated as abandoned
+IDEMPOTENCY_LOCK_SECONDS = float(os.getenv("IDEMPOTENCY_LOCK_SECONDS", 60))
+# how long a duplicate waits for the first request before giving up with 409
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", 10))
+IDEMPOTENCY_POLL_SECONDS = float(os.getenv("IDEMPOTENCY_POLL_SECONDS", 0.05))
+# keys the request fingerprints, which cover passwords on registration
+FINGERPRINT_KEY = (os.getenv("SECRET_KEY") or "").encode()
+
+IdempotencyKeyHeader = Annotated[
+    str | None,
+    Header(
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=255,
+        description="Retries carrying the same key replay the first response.",
+    ),
+]
+
+
+class IdempotencyRecord(NamedTuple):
+    fingerprint: str
+    # both None while the first request is still running
+    status_code: int | None = None
+    body: bytes | None = None
+
+
+def fingerprint(payload: BaseModel) -> str:
+    """Keyed hash of a request body, to reject a key reused for another request."""
+    canonical = json.dumps(payload.model_dump(mode="json"), sort_keys=True)
+    return hmac.new(FINGERPRINT_KEY, canonical.encode(), hashlib.sha256).hexdigest()
+
+
+class IdempotencyStore(ABC):
+    """Interface for stored responses, keyed by scoped idempotency key."""
+
+    @abstractmethod
+    async def claim(self, key: str, fingerprint: str) -> bool:
+        """Reserve `key` for a new request; False if it is already taken."""
+
+    @abstractmethod
+    async def get(self, key: str) -> IdempotencyRecord | None: ...
+
+    @abstractmethod
+    async def complete(self, key: str, status_code: int, body: bytes) -> None:
+        """Store the response of a claimed key for IDEMPOTENCY_TTL_SECONDS."""
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """Drop a claim whose request failed, so a retry runs again."""
+
+    @abstractmethod
+    def stats(self) -> dict: ...
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """Per-worker store, bounded by an LRU cache."""
+
+    def __init__(self, maxsize: int):
+        self.entries = LRUCache(maxsize=maxsize, ttl=IDEMPOTENCY_TTL_SECONDS)
+
+    async def claim(self, key: str, fingerprint: str) -> bool:
+        if await self.entries.get(key) is not None:
+            return False
+        await self.entries.set(key, IdempotencyRecord(fingerprint), ttl=IDEMPOTENCY_LOCK_SECONDS)
+        return True
+
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        return await self.entries.get(key)
+
+    async def complete(self, key: str, status_code: int, body: bytes) -> None:
+        record = await self.entries.get(key)
+        if record is not None:
+            await self.entries.set(key, record._replace(status_code=status_code, body=body))
+
+    async def release(self, key: str) -> None:
+        await self.entries.delete(key)
+
+    def stats(self) -> dict:
+        return {"backend": "memory", **self.entries.stats()}
+
+
+class DatabaseIdempotencyStore(IdempotencyStore):
+    """Store shared by all workers through the idempotency_keys table.
+
+    Every call commits in its own session, so a claim is visible to other
+    workers before the request behind it starts writing.
+    """
+
+    def __init__(self, session_maker=async_session_maker):
+        self.session_maker = session_maker
+
+    async def claim(self, key: str, fingerprint: str) -> bool:
+        now = datetime.utcnow()
+        statement = pg_insert(IdempotencyKey).values(
+            key=key,
+            fingerprint=fingerprint,
+            created_at=now,
+            expires_at=now + timedelta(seconds=IDEMPOTENCY_LOCK_SECONDS),
+        )
+        # take over an expired response or a claim abandoned by a crashed worker
+        statement = statement.on_conflict_do_update(
+            index_elements=[IdempotencyKey.key],
+            set_={
+                "fingerprint": statement.excluded.fingerprint,
+                "status_code": None,
+                "body": None,
+                "created_at": statement.excluded.created_at,
+                "expires_at": statement.excluded.expires_at,
+            },
+            where=IdempotencyKey.expires_at <= now,
+        ).returning(IdempotencyKey.key)
+        async with self.session_maker() as session:
+            claimed = (await session.execute(statement)).first() is not None
+            await session.commit()
+        return claimed
+
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        statement = select(
+            IdempotencyKey.fingerprint, IdempotencyKey.status_code, IdempotencyKey.body
+        ).where(IdempotencyKey.key == key, IdempotencyKey.expires_at > datetime.utcnow())
+        async with self.session_maker() as session:
+            row = (await session.execute(statement)).first()
+        if row is None:
+            return None
+        body = row.body.encode() if row.body is not None else None
+        return IdempotencyRecord(row.fingerprint, row.status_code, body)
+
+    async def complete(self, key: str, status_code: int, body: bytes) -> None:
+        statement = (
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == key)
+            .values(
+                status_code=status_code,
+                body=body.decode(),
+                expires_at=datetime.utcnow() + timedelta(seconds=IDEMPOTENCY_TTL_SECONDS),
+            )
+        )
+        async with self.session_maker() as session:
+            await session.execute(statement)
+            await session.commit()
+
+    async def release(self, key: str) -> None:
+        statement = delete(IdempotencyKey).where(
+            IdempotencyKey.key == key, IdempotencyKey.status_code.is_(None)
+        )
+        async with self.session_maker() as session:
+            await session.execute(statement)
+            await session.commit()
+
+    def stats(self) -> dict:
+        return {"backend": "database"}
+
+
+async def purge_idempotency_keys(session: AsyncSession, now: datetime) -> int:
+    """Delete stored responses and abandoned claims that expired before `now`."""
+    result = await session.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.expires_at <= now)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+class IdempotentRequests:
+    """Runs each scoped key's request once and replays its response to retries.
+
+    Duplicates arriving while the first request runs wait for it: on this
+    worker through an event, on other workers by polling the shared store.
+    Only successful responses are stored; a failed request releases its
+    key so the client's retry runs again.
+    """
+
+    def __init__(self, store: IdempotencyStore):
+        self.store = store
+        # keys whose first request is running on this worker
+        self._running: dict[str, asyncio.Event] = {}
+        self.executions = 0
+        self.replays = 0
+        self.waits = 0
+        self.mismatches = 0
+        self.timeouts = 0
+
+    async def run(
+        self,
+        key: str,
+        payload: BaseModel,
+        status_code: int,
+        action: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Result of `action()`, or a replay of the response stored for `key`."""
+        request_fingerprint = fingerprint(payload)
+        deadline = time.monotonic() + IDEMPOTENCY_WAIT_SECONDS
+        waited = False
+        while not await self.store.claim(key, request_fingerprint):
+            record = await self.store.get(key)
+            if record is None:
+                # released or expired since the claim attempt
+                continue
+            if record.fingerprint != request_fingerprint:
+                self.mismatches += 1
+                # literal: the constant's name differs across supported Starlette versions
+                raise HTTPException(
+                    status_code=422,
+                    detail="Idempotency-Key was already used with a different request",
+                )
+            if record.status_code is not None:
+                self.replays += 1
+                return Response(
+                    content=record.body,
+                    status_code=record.status_code,
+                    media_type="application/json",
+                    headers={"Idempotent-Replayed": "true"},
+                )
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.timeouts += 1
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="A request with this Idempotency-Key is still in progress",
+                )
+            if not waited:
+                self.waits += 1
+                waited = True
+            await self._wait(key, remaining)
+
+        self.executions += 1
+        done = self._running[key] = asyncio.Event()
+        try:
+            try:
+                result = await action()
+            except BaseException:
+                await self.store.release(key)
+                raise
+            await self.store.complete(key, status_code, dump_json(result))
+        finally:
+            self._running.pop(key, None)
+            done.set()
+        return result
+
+    async def _wait(self, key: str, timeout: float) -> None:
+        done = self._running.get(key)
+        if done is None:
+            # claimed by another worker
+            await asyncio.sleep(min(IDEMPOTENCY_POLL_SECONDS, timeout))
+            return
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def stats(self) -> dict:
+        return {
+            **self.store.stats(),
+            "running": len(self._running),
+            "executions": self.executions,
+            "replays": self.replays,
+            "waits": self.waits,
+            "mismatches": self.mismatches,
+            "timeouts": self.timeouts,
+        }
+
+
+idempotent_requests = IdempotentRequests(
+    DatabaseIdempotencyStore()
+    if IDEMPOTENCY_BACKEND == "database"
+    else MemoryIdempotencyStore(IDEMPOTENCY_MAXSIZE)
+)
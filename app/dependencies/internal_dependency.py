@@ -0,0 +1,25 @@
+from typing import Annotated
+from fastapi import Depends, HTTPException, status
+from fastapi.security import APIKeyHeader
+from dotenv import load_dotenv
+import hmac
+import os
+
+load_dotenv()
+
+# the /internal endpoints answer 404 until a token is configured
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
+internal_token_header = APIKeyHeader(name="X-Internal-Token", auto_error=False)
+
+
+async def require_internal_token(
+    token: Annotated[str | None, Depends(internal_token_header)],
+) -> None:
+    """Admit only callers presenting INTERNAL_API_TOKEN."""
+    if not INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if token is None or not hmac.compare_digest(token.encode(), INTERNAL_API_TOKEN.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Invalid internal token"
+        )
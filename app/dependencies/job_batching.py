@@ -0,0 +1,146 @@
+from collections import Counter, defaultdict
+from functools import partial
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.dependencies.db import async_session_maker
+from app.dependencies.job_stats import bump_job_stats
+from app.dependencies.metrics import (
+    job_insert_batch_fallbacks,
+    job_insert_batch_size,
+    job_insert_batch_wait,
+)
+from app.models.job_model import Job
+from dotenv import load_dotenv
+import asyncio
+import os
+import time
+
+load_dotenv()
+
+JOB_INSERT_BATCHING = os.getenv("JOB_INSERT_BATCHING", "false").lower() == "true"
+JOB_INSERT_BATCH_WINDOW_MS = float(os.getenv("JOB_INSERT_BATCH_WINDOW_MS", 2))
+JOB_INSERT_BATCH_MAX = int(os.getenv("JOB_INSERT_BATCH_MAX", 100))
+
+
+class JobInsertCoalescer:
+    """Group-commit for job creation.
+
+    Rows submitted within `window` seconds of the first one (or until
+    `max_batch` rows are waiting) are written by one multi-row INSERT ...
+    RETURNING in a single transaction, so a burst of creations costs one
+    commit. If the batch fails, each row is retried in its own savepoint so
+    only the offending requests see an error.
+    """
+
+    def __init__(self, window: float, max_batch: int, session_maker=async_session_maker):
+        self.window = window
+        self.max_batch = max_batch
+        self.session_maker = session_maker
+        # (row, future, submitted at)
+        self._pending: list[tuple[dict, asyncio.Future, float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._writes: set[asyncio.Task] = set()
+
+    async def submit(self, row: dict) -> Job:
+        """Queue `row` for the next batch and wait for its inserted Job."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((row, future, time.perf_counter()))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._write(batch))
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+            task.add_done_callback(partial(self._settle_if_cancelled, batch))
+
+    async def _write(self, batch: list[tuple[dict, asyncio.Future, float]]) -> None:
+        started = time.perf_counter()
+        job_insert_batch_size.observe((), len(batch))
+        for _, _, submitted in batch:
+            job_insert_batch_wait.observe((), started - submitted)
+
+        rows = [row for row, _, _ in batch]
+        # only ever holds committed jobs, or per-row errors
+        outcomes: list = []
+        error: BaseException | None = None
+        try:
+            async with self.session_maker() as session:
+                try:
+                    result = await session.scalars(
+                        insert(Job).returning(Job, sort_by_parameter_order=True), rows
+                    )
+                    jobs = result.all()
+                    await self._record(session, jobs)
+                    await session.commit()
+                    outcomes = jobs
+                except Exception:
+                    await session.rollback()
+                    job_insert_batch_fallbacks.add(())
+                    try:
+                        outcomes = await self._write_each(session, rows)
+                    except Exception as e:
+                        await session.rollback()
+                        outcomes = [e] * len(rows)
+        except BaseException as e:
+            # a failed rollback, a lost connection or cancellation
+            error = e
+            raise
+        finally:
+            self._settle(batch, outcomes, error)
+
+    def _settle_if_cancelled(self, batch: list, task: asyncio.Task) -> None:
+        # a task cancelled before its first step never reaches _write's finally
+        if task.cancelled():
+            self._settle(batch, [], asyncio.CancelledError())
+
+    def _settle(self, batch: list, outcomes: list, error: BaseException | None) -> None:
+        """Resolve every waiting request; rows without an outcome get the error."""
+        for index, (_, future, _) in enumerate(batch):
+            # the request may have been cancelled while waiting
+            if future.done():
+                continue
+            outcome = outcomes[index] if index < len(outcomes) else error
+            if isinstance(outcome, Job):
+                future.set_result(outcome)
+            elif isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_exception(
+                    RuntimeError(f"Job insert batch was not written: {outcome!r}")
+                )
+
+    async def _write_each(self, session: AsyncSession, rows: list[dict]) -> list:
+        """Insert rows one savepoint at a time; failures become per-row exceptions."""
+        outcomes = []
+        for row in rows:
+            try:
+                async with session.begin_nested():
+                    outcomes.append(
+                        (await session.scalars(insert(Job).returning(Job), [row])).one()
+                    )
+            except Exception as e:
+                outcomes.append(e)
+        await self._record(session, [job for job in outcomes if isinstance(job, Job)])
+        await session.commit()
+        return outcomes
+
+    async def _record(self, session: AsyncSession, jobs: list[Job]) -> None:
+        """Stats for inserted jobs, in the same transaction."""
+        by_user: dict[str, list[Job]] = defaultdict(list)
+        for job in jobs:
+            by_user[job.createdBy].append(job)
+        for username, user_jobs in by_user.items():
+            await bump_job_stats(session, username, Counter(job.status for job in user_jobs))
+
+
+job_inserts = JobInsertCoalescer(JOB_INSERT_BATCH_WINDOW_MS / 1000, JOB_INSERT_BATCH_MAX)
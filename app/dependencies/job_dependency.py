@@ -1,12 +1,109 @@
-from typing import Annotated
-from fastapi import Depends, HTTPException, status
+from typing import Annotated, AsyncIterator
+from fastapi import Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import select
-from app.dependencies.db import get_session
+from sqlalchemy import (
+    and_,
+    delete,
+    false,
+    func,
+    insert,
+    literal_column,
+    null,
+    or_,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
+from app.dependencies.cache import CacheBackend, NullCache, job_cache
+from app.dependencies.db import async_session_maker, get_session
+from app.dependencies.etag import check_etag, weak_etag
+from app.dependencies.idempotency import IdempotencyKeyHeader, idempotent_requests
+from app.dependencies.job_batching import JOB_INSERT_BATCHING, job_inserts
+from app.dependencies.job_events import JOB_EVENTS_RECONNECT_SECONDS, job_events
+from app.dependencies.job_stats import bump_job_stats, get_job_stats, status_transitions
+from app.dependencies.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    decode_sync_token,
+    encode_cursor,
+    encode_rank_cursor,
+    encode_sync_token,
+)
+from app.dependencies.read_your_writes import get_read_session, record_write
+from app.dependencies.serialization import dump_json, to_jsonable
 from app.dependencies.user_dependency import get_username
-from app.models.job_model import Job, JobBase, JobUpdate
+from app.models.job_model import (
+    JOB_FIELDS,
+    JOB_SEARCH_VECTOR,
+    Job,
+    JobBase,
+    JobBulkResult,
+    JobBulkUpdate,
+    JobChangesQuery,
+    JobExportQuery,
+    JobFilters,
+    JobListQuery,
+    JobSearchQuery,
+    JobSelection,
+    JobStats,
+    JobStatus,
+    JobTombstone,
+    JobUpdate,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from uuid import UUID
+from uuid import UUID, uuid4
+from datetime import datetime, timedelta
 from app.models.user_model import User
+from collections import Counter
+from dotenv import load_dotenv
+import asyncio
+import csv
+import io
+import json
+import os
+import re
+import time
+
+load_dotenv()
+
+EXPORT_CHUNK_SIZE = int(os.getenv("JOBS_EXPORT_CHUNK_SIZE", 1000))
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+BULK_MAX_BATCH = int(os.getenv("JOBS_BULK_MAX_BATCH", 10000))
+# a sync re-reads changes this far before the previous sync started, to catch
+# writes that committed late or were stamped by a server with a slower clock
+SYNC_OVERLAP_SECONDS = float(os.getenv("JOBS_SYNC_OVERLAP_SECONDS", 5))
+TOMBSTONE_RETENTION_DAYS = int(os.getenv("JOB_TOMBSTONE_RETENTION_DAYS", 30))
+# comment line sent on idle event streams so proxies keep them open
+JOB_EVENTS_KEEPALIVE_SECONDS = float(os.getenv("JOB_EVENTS_KEEPALIVE_SECONDS", 15))
+
+# cache tag shared by every cached page of the public listing
+JOB_LIST_TAG = "jobs:list"
+
+
+def job_cache_key(job_id: UUID) -> str:
+    return f"jobs:{job_id}"
+
+
+async def invalidate_jobs(*job_ids: UUID) -> None:
+    """Drop cached reads affected by a write to `job_ids`."""
+    for job_id in job_ids:
+        await job_cache.delete(job_cache_key(job_id))
+    # any write can move a job into or out of a listing page
+    await job_cache.invalidate_tag(JOB_LIST_TAG)
+
+
+_no_cache = NullCache()
+
+
+def read_cache(session: AsyncSession) -> CacheBackend:
+    """`job_cache`, unless `session` reads from the primary for read-your-writes.
+
+    Entries may have been refilled from a lagging replica, so a user who
+    has just written bypasses them.
+    """
+    return _no_cache if session.info.get("primary") else job_cache
 
 
 async def get_job(session: AsyncSession, job_id: UUID) -> Job:
@@ -16,30 +113,481 @@ async def get_job(session: AsyncSession, job_id: UUID) -> Job:
     return job
 
 
-async def get_jobs(session: AsyncSession = Depends(get_session)) -> list[Job]:
-    result = await session.execute(select(Job))
-    jobs = result.scalars().all()  # convert Result to list of Job instances
-    return jobs
+async def get_cached_job(session: AsyncSession, job_id: UUID) -> Job:
+    """Read-through cached `get_job` for the public detail endpoint."""
+    return await read_cache(session).get_or_load(
+        job_cache_key(job_id), lambda: get_job(session, job_id)
+    )
+
+
+async def read_job(
+    job_id: UUID,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_read_session),
+) -> Job:
+    """Public job detail with If-None-Match support."""
+    if request.headers.get("if-none-match"):
+        # revalidate from the cache or a single-column lookup, without loading the row
+        job = await read_cache(session).get(job_cache_key(job_id))
+        if job is not None:
+            updated_at = job.updated_at
+        else:
+            updated_at = await session.scalar(
+                select(Job.updated_at).where(Job.id == job_id)
+            )
+            if updated_at is None:
+                raise HTTPException(status_code=404, detail="Job not found")
+        check_etag(request, response, weak_etag("job", job_id, updated_at.isoformat()))
+        if job is not None:
+            return job
+
+    job = await get_cached_job(session, job_id)
+    check_etag(request, response, weak_etag("job", job.id, job.updated_at.isoformat()))
+    return job
+
+
+def job_columns(fields: list[str] | None = None) -> list:
+    """Table columns for a read-only listing; the keyset columns are always selected."""
+    wanted = set(fields or JOB_FIELDS) | {"created_at", "id"}
+    return [Job.__table__.c[name] for name in JOB_FIELDS if name in wanted]
+
+
+def job_rows(rows, fields: list[str] | None = None) -> list[dict]:
+    """Plain dicts of the requested fields, in response field order."""
+    names = [name for name in JOB_FIELDS if name in fields] if fields else JOB_FIELDS
+    return [{name: row._mapping[name] for name in names} for row in rows]
+
+
+def filter_jobs(statement, filters: JobFilters):
+    """Translate list filters into WHERE clauses."""
+    if filters.status is not None:
+        statement = statement.where(Job.status == filters.status)
+    if filters.company:
+        statement = statement.where(Job.company.startswith(filters.company, autoescape=True))
+    if filters.position:
+        statement = statement.where(Job.position.startswith(filters.position, autoescape=True))
+    if filters.created_after is not None:
+        statement = statement.where(Job.created_at >= filters.created_after)
+    if filters.created_before is not None:
+        statement = statement.where(Job.created_at < filters.created_before)
+    return statement
+
+
+def select_user_jobs(username: str, selection: JobSelection) -> list:
+    """WHERE clauses for a bulk operation, always scoped to the owner."""
+    if selection.ids is not None and len(selection.ids) > BULK_MAX_BATCH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {BULK_MAX_BATCH} ids per request",
+        )
+    criteria = [Job.createdBy == username]
+    if selection.ids is not None:
+        criteria.append(Job.id.in_(selection.ids))
+    if selection.status is not None:
+        criteria.append(Job.status == selection.status)
+    if selection.created_after is not None:
+        criteria.append(Job.created_at >= selection.created_after)
+    if selection.created_before is not None:
+        criteria.append(Job.created_at < selection.created_before)
+    return criteria
+
+
+async def paginate_jobs(
+    session: AsyncSession,
+    statement,
+    cursor: str | None,
+    limit: int,
+    descending: bool = False,
+    fields: list[str] | None = None,
+) -> dict:
+    """Fetch one keyset page of `statement` ordered by (created_at, id).
+
+    `statement` selects `job_columns()`, so rows are plain tuples that never
+    enter the session identity map. The page is a dict shaped like `JobPage`.
+    """
+    keyset = tuple_(Job.created_at, Job.id)
+    if cursor:
+        position = tuple_(*decode_cursor(cursor))
+        statement = statement.where(keyset < position if descending else keyset > position)
+
+    if descending:
+        statement = statement.order_by(Job.created_at.desc(), Job.id.desc())
+    else:
+        statement = statement.order_by(Job.created_at, Job.id)
+    # one extra row tells us whether another page exists
+    statement = statement.limit(limit + 1)
+    rows = (await session.execute(statement)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return {"items": job_rows(rows, fields), "next_cursor": next_cursor}
+
+
+async def get_jobs(
+    query: Annotated[JobListQuery, Query()],
+    session: AsyncSession = Depends(get_read_session),
+) -> dict:
+    statement = filter_jobs(select(*job_columns(query.fields)), query)
+    return await read_cache(session).get_or_load(
+        f"{JOB_LIST_TAG}:{query.model_dump_json()}",
+        lambda: paginate_jobs(
+            session,
+            statement,
+            query.cursor,
+            query.limit,
+            descending=query.order == "desc",
+            fields=query.fields,
+        ),
+        tags=(JOB_LIST_TAG,),
+    )
+
+
+async def user_jobs_version(session: AsyncSession, username: str) -> tuple:
+    """Values that change on every write to `username`'s jobs, without scanning them.
+
+    Inserts and updates move the latest updated_at, deletes move the latest
+    tombstone and the job_stats counters; each is one index lookup.
+    """
+    # every column is a scalar subquery, so a missing job_stats row only
+    # blanks the counters instead of the whole version
+    counters = (
+        select(counter).where(JobStats.username == username).scalar_subquery()
+        for counter in (JobStats.pending, JobStats.interviewed, JobStats.declined)
+    )
+    row = (
+        await session.execute(
+            select(
+                select(func.max(Job.updated_at))
+                .where(Job.createdBy == username)
+                .scalar_subquery(),
+                select(func.max(JobTombstone.deleted_at))
+                .where(JobTombstone.createdBy == username)
+                .scalar_subquery(),
+                *counters,
+            )
+        )
+    ).one()
+    return tuple(row)
 
 
 async def get_user_jobs(
-    username: str = Depends(get_username), session: AsyncSession = Depends(get_session)
-) -> list[Job]:
-    result = await session.execute(select(Job).where(Job.createdBy == username))
-    jobs = result.scalars().all()  # convert Result to list of Job instances
-    return jobs
+    query: Annotated[JobListQuery, Query()],
+    request: Request,
+    response: Response,
+    username: str = Depends(get_username),
+    session: AsyncSession = Depends(get_session),
+) -> dict:
+    check_etag(
+        request,
+        response,
+        weak_etag("jobs", *await user_jobs_version(session, username), query.model_dump_json()),
+    )
+
+    statement = filter_jobs(
+        select(*job_columns(query.fields)).where(Job.createdBy == username), query
+    )
+    return await paginate_jobs(
+        session,
+        statement,
+        query.cursor,
+        query.limit,
+        descending=query.order == "desc",
+        fields=query.fields,
+    )
+
+
+def changed_after(changed_at, row_id, since, position) -> list:
+    """Delta-sync bounds: at or after `since`, strictly after the keyset `position`."""
+    criteria = []
+    if since is not None:
+        criteria.append(changed_at >= since)
+    if position is not None:
+        criteria.append(tuple_(changed_at, row_id) > tuple_(*position))
+    return criteria
+
+
+async def get_user_job_changes(
+    query: Annotated[JobChangesQuery, Query()],
+    username: str = Depends(get_username),
+    session: AsyncSession = Depends(get_session),
+) -> dict:
+    """Jobs created or updated and ids deleted since `query.since`, oldest first.
+
+    Changes and tombstones are merged into one (changed_at, id) keyset so a
+    sync can span several pages. Each sync re-reads SYNC_OVERLAP_SECONDS
+    before the previous one started, so clients must apply both lists
+    idempotently.
+    """
+    now = datetime.utcnow()
+    since, position, synced_at = None, None, now
+    if query.since:
+        since, position, synced_at = decode_sync_token(query.since)
+        if since is not None and since < now - timedelta(days=TOMBSTONE_RETENTION_DAYS):
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="Sync token expired, download the full list again",
+            )
+        if position is None:
+            # a new sync, not the next page of one in progress
+            synced_at = now
+
+    statement = select(
+        *job_columns(), Job.updated_at.label("changed_at"), false().label("deleted")
+    ).where(Job.createdBy == username, *changed_after(Job.updated_at, Job.id, since, position))
+    if since is not None:
+        # a full download has nothing to delete locally
+        tombstones = select(
+            *(JobTombstone.id if name == "id" else null().label(name) for name in JOB_FIELDS),
+            JobTombstone.deleted_at.label("changed_at"),
+            true().label("deleted"),
+        ).where(
+            JobTombstone.createdBy == username,
+            *changed_after(JobTombstone.deleted_at, JobTombstone.id, since, position),
+        )
+        statement = union_all(statement, tombstones)
+    columns = statement.selected_columns
+    statement = statement.order_by(columns.changed_at, columns.id).limit(query.limit + 1)
+    rows = (await session.execute(statement)).all()
+
+    has_more = len(rows) > query.limit
+    rows = rows[: query.limit]
+    if has_more:
+        token = encode_sync_token(since, (rows[-1].changed_at, rows[-1].id), synced_at)
+    else:
+        token = encode_sync_token(
+            synced_at - timedelta(seconds=SYNC_OVERLAP_SECONDS), None, synced_at
+        )
+    return {
+        "items": job_rows([row for row in rows if not row.deleted]),
+        "deleted": [row.id for row in rows if row.deleted],
+        "next_token": token,
+        "has_more": has_more,
+    }
+
+
+async def record_tombstones(session: AsyncSession, username: str, ids: list[UUID]) -> None:
+    """Remember deleted job ids so delta sync can report them."""
+    if ids:
+        deleted_at = datetime.utcnow()
+        await session.execute(
+            insert(JobTombstone),
+            [{"id": job_id, "createdBy": username, "deleted_at": deleted_at} for job_id in ids],
+        )
+
+
+async def purge_tombstones(session: AsyncSession, older_than: datetime) -> int:
+    """Drop tombstones no valid sync token can ask for any more."""
+    result = await session.execute(
+        delete(JobTombstone).where(JobTombstone.deleted_at < older_than)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+async def read_job_stats(
+    username: Annotated[str, Depends(get_username)],
+    session: AsyncSession = Depends(get_session),
+) -> JobStats:
+    return await get_job_stats(session, username)
+
+
+async def rank_jobs(
+    session: AsyncSession,
+    statement,
+    rank,
+    match: str,
+    after: tuple[float, UUID] | None,
+    limit: int,
+) -> dict:
+    """Fetch one keyset page of search hits ordered by (rank desc, id)."""
+    if after:
+        last_rank, last_id = after
+        statement = statement.where(
+            or_(rank < last_rank, and_(rank == last_rank, Job.id > last_id))
+        )
+    statement = (
+        statement.add_columns(rank.label("rank"))
+        .order_by(rank.desc(), Job.id)
+        .limit(limit + 1)
+    )
+    rows = (await session.execute(statement)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_rank_cursor(match, rows[-1].rank, rows[-1].id)
+    return {"items": job_rows(rows), "next_cursor": next_cursor, "match": match}
+
+
+async def search_jobs(
+    query: Annotated[JobSearchQuery, Query()],
+    session: AsyncSession = Depends(get_session),
+) -> dict:
+    """Ranked prefix search over company and position.
+
+    Falls back to trigram similarity on company when full-text search finds
+    nothing, so misspelt company names still match.
+    """
+    match, after = "fulltext", None
+    if query.cursor:
+        match, last_rank, last_id = decode_rank_cursor(query.cursor)
+        after = (last_rank, last_id)
+
+    # word characters only, so user input cannot inject tsquery operators
+    terms = re.findall(r"\w+", query.q)
+    if match == "fulltext" and terms:
+        ts_query = func.to_tsquery(
+            literal_column("'simple'"), " & ".join(f"{term}:*" for term in terms)
+        )
+        document = literal_column(JOB_SEARCH_VECTOR)
+        statement = select(*job_columns()).where(document.op("@@")(ts_query))
+        page = await rank_jobs(
+            session, statement, func.ts_rank_cd(document, ts_query), match, after, query.limit
+        )
+        if page["items"] or after:
+            return page
+
+    statement = select(*job_columns()).where(Job.company.op("%")(query.q))
+    return await rank_jobs(
+        session,
+        statement,
+        func.similarity(Job.company, query.q),
+        "trigram",
+        after if match == "trigram" else None,
+        query.limit,
+    )
+
+
+async def stream_jobs(
+    statement, format: str, fields: list[str] | None = None
+) -> AsyncIterator[str]:
+    """Yield `statement` rows as NDJSON or CSV, one chunk of rows at a time."""
+    statement = statement.order_by(Job.created_at, Job.id).execution_options(
+        yield_per=EXPORT_CHUNK_SIZE
+    )
+    # the response body outlives the request dependencies, so use a dedicated session
+    async with async_session_maker() as session:
+        result = await session.stream(statement)
+        columns = [name for name in JOB_FIELDS if name in fields] if fields else JOB_FIELDS
+        if format == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(columns)
+            yield buffer.getvalue()
+
+        async for rows in result.partitions():
+            buffer = io.StringIO()
+            if format == "csv":
+                writer = csv.writer(buffer)
+                for row in job_rows(rows, fields):
+                    writer.writerow(to_jsonable(list(row.values())))
+            else:
+                for row in job_rows(rows, fields):
+                    buffer.write(dump_json(row).decode())
+                    buffer.write("\n")
+            yield buffer.getvalue()
+
+
+def export_response(
+    statement, format: str, fields: list[str] | None = None
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_jobs(statement, format, fields),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="jobs.{format}"'},
+    )
+
+
+def export_jobs(query: JobExportQuery) -> StreamingResponse:
+    statement = filter_jobs(select(*job_columns(query.fields)), query)
+    return export_response(statement, query.format, query.fields)
+
+
+async def job_event_stream(
+    username: str, expires_at: float | None = None
+) -> AsyncIterator[str]:
+    """Server-Sent Events for changes to `username`'s jobs.
+
+    The stream ends with an `expired` event once the token it was opened with
+    passes `expires_at`; the client reconnects with a fresh token.
+    """
+    async with job_events.subscribe(username) as queue:
+        yield f"retry: {int(JOB_EVENTS_RECONNECT_SECONDS * 1000)}\n\n"
+        while True:
+            timeout = JOB_EVENTS_KEEPALIVE_SECONDS
+            if expires_at is not None:
+                remaining = expires_at - time.time()
+                if remaining <= 0:
+                    yield "event: expired\ndata: {}\n\n"
+                    return
+                timeout = min(timeout, remaining)
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                if expires_at is None or time.time() < expires_at:
+                    yield ": keepalive\n\n"
+                continue
+            yield f"event: {event['op']}\ndata: {json.dumps(event)}\n\n"
+
+
+async def stream_user_jobs(
+    username: str, expires_at: float | None = None
+) -> StreamingResponse:
+    if not job_events.available:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Live job updates are not available",
+        )
+    try:
+        await job_events.start()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to listen for job updates: {str(e)}",
+        )
+    return StreamingResponse(
+        job_event_stream(username, expires_at),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def export_user_jobs(username: str, query: JobExportQuery) -> StreamingResponse:
+    statement = filter_jobs(
+        select(*job_columns(query.fields)).where(Job.createdBy == username), query
+    )
+    return export_response(statement, query.format, query.fields)
 
 
 async def create_job(
     username: Annotated[str, Depends(get_username)],
     job: JobBase,
+    idempotency_key: IdempotencyKeyHeader = None,
     session: AsyncSession = Depends(get_session),
 ) -> Job:
+    if idempotency_key:
+        return await idempotent_requests.run(
+            f"jobs:{username}:{idempotency_key}",
+            job,
+            status.HTTP_201_CREATED,
+            lambda: insert_job(session, username, job),
+        )
+    return await insert_job(session, username, job)
+
+
+async def insert_job(session: AsyncSession, username: str, job: JobBase) -> Job:
+    if JOB_INSERT_BATCHING:
+        return await create_job_batched(username, job)
     try:
         val_job = Job(company=job.company, position=job.position, createdBy=username)
         session.add(val_job)
+        await bump_job_stats(session, username, Counter([val_job.status]))
         await session.commit()
         await session.refresh(val_job)
+        await invalidate_jobs(val_job.id)
+        record_write()
         return val_job
     except Exception as e:
         await session.rollback()
@@ -49,6 +597,144 @@ async def create_job(
         )
 
 
+async def create_job_batched(username: str, job: JobBase) -> Job:
+    """`insert_job` through the insert coalescer, sharing a commit with concurrent creations."""
+    try:
+        row = Job(company=job.company, position=job.position, createdBy=username).model_dump()
+        created = await job_inserts.submit(row)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create job: {str(e)}",
+        )
+    await invalidate_jobs(created.id)
+    record_write()
+    return created
+
+
+async def create_jobs(
+    username: Annotated[str, Depends(get_username)],
+    jobs: Annotated[list[JobBase], Body(min_length=1, max_length=BULK_MAX_BATCH)],
+    session: AsyncSession = Depends(get_session),
+) -> list[dict]:
+    """Insert many jobs in one transaction with multi-row Core INSERTs.
+
+    Every column is generated here, so the rows are returned as built
+    instead of being read back or turned into ORM instances.
+    """
+    try:
+        now = datetime.utcnow()
+        rows = [
+            {
+                "created_at": now,
+                "updated_at": now,
+                "id": uuid4(),
+                "company": job.company,
+                "position": job.position,
+                "createdBy": username,
+                "status": JobStatus.pending,
+            }
+            for job in jobs
+        ]
+        # RETURNING makes SQLAlchemy send multi-row VALUES pages instead of one
+        # statement per row, so the change trigger fires once per page
+        await session.execute(
+            insert(Job.__table__).returning(Job.__table__.c.id, sort_by_parameter_order=True),
+            rows,
+        )
+        await bump_job_stats(session, username, Counter({JobStatus.pending: len(rows)}))
+        await session.commit()
+        await invalidate_jobs()
+        record_write()
+        return rows
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create jobs: {str(e)}",
+        )
+
+
+async def update_jobs(
+    username: Annotated[str, Depends(get_username)],
+    bulk: JobBulkUpdate,
+    session: AsyncSession = Depends(get_session),
+) -> JobBulkResult:
+    """Set the status of every selected job with one UPDATE ... RETURNING."""
+    # lock the selected rows and keep their previous status for the counters
+    previous = (
+        select(Job.id, Job.status)
+        .where(*select_user_jobs(username, bulk.where))
+        .with_for_update()
+        .subquery()
+    )
+    statement = (
+        update(Job)
+        .where(Job.id == previous.c.id)
+        .values(status=bulk.status)
+        .returning(Job.id, previous.c.status)
+        .execution_options(synchronize_session=False)
+    )
+    try:
+        rows = (await session.execute(statement)).all()
+        ids = [job_id for job_id, _ in rows]
+        await bump_job_stats(
+            session, username, status_transitions((old, bulk.status) for _, old in rows)
+        )
+        await session.commit()
+        await invalidate_jobs(*ids)
+        record_write()
+        return JobBulkResult(count=len(ids), ids=ids)
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to update jobs: {str(e)}",
+        )
+
+
+async def delete_jobs(
+    username: Annotated[str, Depends(get_username)],
+    selection: JobSelection,
+    session: AsyncSession = Depends(get_session),
+) -> JobBulkResult:
+    """Delete every selected job with one DELETE ... RETURNING."""
+    statement = (
+        delete(Job)
+        .where(*select_user_jobs(username, selection))
+        .returning(Job.id, Job.status)
+        .execution_options(synchronize_session=False)
+    )
+    try:
+        rows = (await session.execute(statement)).all()
+        ids = [job_id for job_id, _ in rows]
+        await bump_job_stats(
+            session, username, status_transitions((old, None) for _, old in rows)
+        )
+        await record_tombstones(session, username, ids)
+        await session.commit()
+        await invalidate_jobs(*ids)
+        record_write()
+        return JobBulkResult(count=len(ids), ids=ids)
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to delete jobs: {str(e)}",
+        )
+
+
+async def job_write_error(session: AsyncSession, job_id: UUID, action: str) -> HTTPException:
+    """Explain why an owner-scoped write matched no row: missing job or not the owner."""
+    owner = await session.scalar(select(Job.createdBy).where(Job.id == job_id))
+    if owner is None:
+        return HTTPException(status_code=404, detail="Job not found")
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"You are not allowed to {action} this job",
+    )
+
+
 async def update_job(
     username: Annotated[str, Depends(get_username)],
     job_id: UUID,
@@ -56,23 +742,34 @@ async def update_job(
     session: AsyncSession = Depends(get_session),
 ) -> Job:
     try:
-        old_job = await get_job(session, job_id)
-        if not old_job:
-            raise HTTPException(status_code=404, detail="Job not found")
-
-        # Authorization check
-        if old_job.createdBy != username:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You are not allowed to update this job",
-            )
-
+        # ownership check, update and read-back in one round trip; the locked
+        # subquery hands back the previous status for the counters
         job_data = job.model_dump(exclude_unset=True)
-        old_job.sqlmodel_update(job_data)
-        session.add(old_job)
+        previous = (
+            select(Job.id, Job.status)
+            .where(Job.id == job_id, Job.createdBy == username)
+            .with_for_update()
+            .subquery()
+        )
+        statement = (
+            update(Job)
+            .where(Job.id == previous.c.id)
+            .values(**job_data, updated_at=datetime.utcnow())
+            .returning(Job, previous.c.status)
+            .execution_options(synchronize_session=False)
+        )
+        row = (await session.execute(statement)).first()
+        if not row:
+            raise await job_write_error(session, job_id, "update")
+
+        updated_job, old_status = row
+        await bump_job_stats(
+            session, username, status_transitions([(old_status, updated_job.status)])
+        )
         await session.commit()
-        await session.refresh(old_job)
-        return old_job
+        await invalidate_jobs(updated_job.id)
+        record_write()
+        return updated_job
 
     except HTTPException:
         raise
@@ -90,19 +787,21 @@ async def delete_job(
     session: AsyncSession = Depends(get_session),
 ) -> Job:
     try:
-        old_job = await get_job(session, job_id)
+        statement = (
+            delete(Job)
+            .where(Job.id == job_id, Job.createdBy == username)
+            .returning(Job)
+            .execution_options(synchronize_session=False)
+        )
+        old_job = (await session.execute(statement)).scalars().first()
         if not old_job:
-            raise HTTPException(status_code=404, detail="Job not found")
-
-        # Authorization check
-        if old_job.createdBy != username:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You are not allowed to delete this job",
-            )
+            raise await job_write_error(session, job_id, "delete")
 
-        await session.delete(old_job)
+        await bump_job_stats(session, username, status_transitions([(old_job.status, None)]))
+        await record_tombstones(session, username, [old_job.id])
         await session.commit()
+        await invalidate_jobs(old_job.id)
+        record_write()
         return old_job
 
     except HTTPException:
@@ -0,0 +1,135 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from sqlalchemy.engine import make_url
+from app.dependencies.db import DATABASE_URL
+from dotenv import load_dotenv
+import asyncio
+import asyncpg
+import json
+import os
+
+load_dotenv()
+
+JOB_EVENTS_ENABLED = os.getenv("JOB_EVENTS_ENABLED", "true").lower() == "true"
+JOB_EVENTS_QUEUE_SIZE = int(os.getenv("JOB_EVENTS_QUEUE_SIZE", 100))
+JOB_EVENTS_RECONNECT_SECONDS = float(os.getenv("JOB_EVENTS_RECONNECT_SECONDS", 5))
+
+# published by the statement-level triggers on jobs (migration 0004), inside
+# the writing statement, as {"op", "user", "ids"} per user and statement
+CHANNEL = "job_changes"
+# queued in place of a subscriber's backlog when events had to be dropped
+RESYNC = {"op": "resync", "ids": []}
+
+
+def listen_dsn(url: str | None) -> str | None:
+    """Plain asyncpg DSN for the LISTEN connection, or None off Postgres."""
+    if not url or make_url(url).get_backend_name() != "postgresql":
+        return None
+    return make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class JobEventBroker:
+    """Fans job change notifications out to the subscribers of this worker.
+
+    A single LISTEN connection is opened on the first subscription and kept
+    until `stop()`. Subscribers that fall behind, or that were connected
+    while the LISTEN connection was down, get a `resync` event instead of
+    the events they missed.
+    """
+
+    def __init__(self, dsn: str | None, queue_size: int):
+        self.dsn = dsn
+        self.queue_size = queue_size
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._connection: asyncpg.Connection | None = None
+        self._connecting = asyncio.Lock()
+        self._reconnect_task: asyncio.Task | None = None
+        self.delivered = 0
+        self.resyncs = 0
+
+    @property
+    def available(self) -> bool:
+        return JOB_EVENTS_ENABLED and self.dsn is not None
+
+    async def start(self) -> None:
+        """Open the LISTEN connection if it is not open yet."""
+        async with self._connecting:
+            if self._connection is not None and not self._connection.is_closed():
+                return
+            connection = await asyncpg.connect(self.dsn)
+            await connection.add_listener(CHANNEL, self._dispatch)
+            connection.add_termination_listener(self._connection_lost)
+            self._connection = connection
+
+    async def stop(self) -> None:
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
+
+    @asynccontextmanager
+    async def subscribe(self, username: str) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self._subscribers.setdefault(username, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(username)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[username]
+
+    def _offer(self, queue: asyncio.Queue, event: dict) -> None:
+        try:
+            queue.put_nowait(event)
+            self.delivered += 1
+        except asyncio.QueueFull:
+            # a slow reader gets one resync instead of an ever-growing backlog
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC)
+            self.resyncs += 1
+
+    def _dispatch(self, connection, pid: int, channel: str, payload: str) -> None:
+        event = json.loads(payload)
+        for queue in self._subscribers.get(event.pop("user"), ()):
+            self._offer(queue, event)
+
+    def _connection_lost(self, connection) -> None:
+        if connection is not self._connection:
+            return
+        self._connection = None
+        for queues in self._subscribers.values():
+            for queue in queues:
+                self._offer(queue, RESYNC)
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        while True:
+            await asyncio.sleep(JOB_EVENTS_RECONNECT_SECONDS)
+            try:
+                await self.start()
+            except (OSError, asyncpg.PostgresError):
+                continue
+            # anything committed while we were away was missed
+            for queues in self._subscribers.values():
+                for queue in queues:
+                    self._offer(queue, RESYNC)
+            self._reconnect_task = None
+            return
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.available,
+            "listening": self._connection is not None and not self._connection.is_closed(),
+            "users": len(self._subscribers),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "delivered": self.delivered,
+            "resyncs": self.resyncs,
+        }
+
+
+job_events = JobEventBroker(listen_dsn(DATABASE_URL), JOB_EVENTS_QUEUE_SIZE)
@@ -0,0 +1,60 @@
+from collections import Counter
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.job_model import Job, JobStats, JobStatus
+
+
+async def bump_job_stats(
+    session: AsyncSession, username: str, deltas: Counter
+) -> None:
+    """Add `deltas` ({JobStatus: change}) to the user's counters in the current transaction."""
+    values = {status.value: deltas.get(status, 0) for status in JobStatus}
+    if not any(values.values()):
+        return
+    statement = pg_insert(JobStats).values(username=username, **values)
+    statement = statement.on_conflict_do_update(
+        index_elements=[JobStats.username],
+        set_={
+            name: getattr(JobStats, name) + getattr(statement.excluded, name)
+            for name, delta in values.items()
+            if delta
+        },
+    )
+    await session.execute(statement)
+
+
+def status_transitions(changes) -> Counter:
+    """Counter deltas for (old_status, new_status) pairs; None means no row."""
+    deltas = Counter()
+    for old, new in changes:
+        if old is not None:
+            deltas[JobStatus(old)] -= 1
+        if new is not None:
+            deltas[JobStatus(new)] += 1
+    return deltas
+
+
+async def get_job_stats(session: AsyncSession, username: str) -> JobStats:
+    stats = await session.get(JobStats, username)
+    return stats or JobStats(username=username)
+
+
+async def rebuild_job_stats(session: AsyncSession) -> int:
+    """Recompute every counter from the jobs table; returns the number of users."""
+    if session.bind.dialect.name == "postgresql":
+        # block job writes (not reads) so the recount is exact
+        await session.execute(text("LOCK TABLE jobs IN SHARE MODE"))
+    await session.execute(delete(JobStats))
+    counts = select(
+        Job.createdBy,
+        *(
+            func.count().filter(Job.status == status).label(status.value)
+            for status in JobStatus
+        ),
+    ).group_by(Job.createdBy)
+    columns = ["username", *(status.value for status in JobStatus)]
+    await session.execute(JobStats.__table__.insert().from_select(columns, counts))
+    users = await session.scalar(select(func.count()).select_from(JobStats))
+    await session.commit()
+    return users
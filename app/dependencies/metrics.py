@@ -0,0 +1,234 @@
+from bisect import bisect_left
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import BaseRoute, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from dotenv import load_dotenv
+import os
+import time
+
+load_dotenv()
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+WAIT_BUCKETS = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1)
+# requests that match no route share one label, so scans cannot grow the series count
+UNMATCHED_ROUTE = "<unmatched>"
+
+# [statements, seconds] of the current request; shared with tasks it spawns
+_db_usage: ContextVar[list | None] = ContextVar("db_usage", default=None)
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a tuple of label values."""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...], buckets: tuple):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, labels: tuple, value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, series in self._series.items():
+            base = _labels(self.labels, labels)
+            prefix = f"{base}," if base else ""
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series):
+                cumulative += count
+                lines.append(
+                    f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}'
+                )
+            lines.append(f"{_series(self.name + '_sum', base)} {series[-1]}")
+            lines.append(f"{_series(self.name + '_count', base)} {cumulative}")
+        return lines
+
+
+class Counter:
+    """Counter (or gauge) keyed by a tuple of label values."""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...], kind: str = "counter"):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.kind = kind
+        self._series: dict[tuple, float] = {}
+
+    def add(self, labels: tuple, value: float = 1) -> None:
+        self._series[labels] = self._series.get(labels, 0) + value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for labels, value in self._series.items():
+            lines.append(f"{_series(self.name, _labels(self.labels, labels))} {value}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple[str, ...], values: tuple) -> str:
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+
+
+def _series(name: str, labels: str) -> str:
+    return f"{name}{{{labels}}}" if labels else name
+
+
+requests_total = Counter(
+    "http_requests_total", "HTTP requests handled.", ("method", "route", "status")
+)
+requests_in_flight = Counter(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled.",
+    ("method", "route"),
+    kind="gauge",
+)
+request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the last response byte.",
+    ("method", "route"),
+    LATENCY_BUCKETS,
+)
+request_db_statements = Histogram(
+    "http_request_db_statements",
+    "SQL statements executed per request.",
+    ("method", "route"),
+    STATEMENT_BUCKETS,
+)
+request_db_duration = Histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL statements per request.",
+    ("method", "route"),
+    LATENCY_BUCKETS,
+)
+job_insert_batch_size = Histogram(
+    "job_insert_batch_size",
+    "Job creations written per coalesced INSERT.",
+    (),
+    BATCH_SIZE_BUCKETS,
+)
+job_insert_batch_wait = Histogram(
+    "job_insert_batch_wait_seconds",
+    "Time a job creation waited for its batch to be written.",
+    (),
+    WAIT_BUCKETS,
+)
+job_insert_batch_fallbacks = Counter(
+    "job_insert_batch_fallbacks_total",
+    "Coalesced INSERTs that failed and were retried row by row.",
+    (),
+)
+METRICS = (
+    requests_total,
+    requests_in_flight,
+    request_duration,
+    request_db_statements,
+    request_db_duration,
+    job_insert_batch_size,
+    job_insert_batch_wait,
+    job_insert_batch_fallbacks,
+)
+
+
+def render_metrics() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def route_label(scope: Scope) -> str:
+    """Templated path of the route that handled `scope`, e.g. /jobs/jobs/{job_id}."""
+    route = scope.get("route")
+    return route.path if route is not None else UNMATCHED_ROUTE
+
+
+def track_in_flight(route: BaseRoute) -> None:
+    """Wrap `route`'s ASGI app so the in-flight gauge carries its path."""
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        labels = (scope["method"], route.path)
+        requests_in_flight.add(labels, 1)
+        try:
+            await handler(scope, receive, send)
+        finally:
+            requests_in_flight.add(labels, -1)
+
+    handler = route.app
+    route.app = app
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-route request metrics.
+
+    Labels come from the route the router stored in the scope, so no extra
+    path matching is done; SQL statements are attributed to the request
+    through a context variable set here.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.instrumented = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        if not self.instrumented:
+            for route in scope["app"].router.routes:
+                if isinstance(route, Route):
+                    track_in_flight(route)
+            self.instrumented = True
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        usage = [0, 0.0]
+        token = _db_usage.set(usage)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _db_usage.reset(token)
+            labels = (scope["method"], route_label(scope))
+            request_duration.observe(labels, elapsed)
+            requests_total.add(labels + (status_code,))
+            request_db_statements.observe(labels, usage[0])
+            request_db_duration.observe(labels, usage[1])
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _db_usage.get() is not None:
+        context.metrics_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    usage = _db_usage.get()
+    started = getattr(context, "metrics_start", None)
+    if usage is not None and started is not None:
+        usage[0] += 1
+        usage[1] += time.perf_counter() - started
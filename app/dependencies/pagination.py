@@ -0,0 +1,96 @@
+from datetime import datetime
+from uuid import UUID
+from fastapi import HTTPException, status
+from dotenv import load_dotenv
+import base64
+import json
+import os
+
+load_dotenv()
+
+DEFAULT_PAGE_SIZE = int(os.getenv("JOBS_PAGE_SIZE", 50))
+MAX_PAGE_SIZE = int(os.getenv("JOBS_MAX_PAGE_SIZE", 200))
+
+
+def _encode(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+    )
+
+
+def encode_cursor(created_at: datetime, job_id: UUID) -> str:
+    """Encode the (created_at, id) keyset position of the last row as an opaque token."""
+    return _encode([created_at.isoformat(), str(job_id)])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a token produced by `encode_cursor`."""
+    try:
+        created_at, job_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), UUID(job_id)
+    except (ValueError, TypeError):
+        raise invalid_cursor()
+
+
+def encode_rank_cursor(match: str, rank: float, job_id: UUID) -> str:
+    """Encode the (rank, id) position of the last search hit and how it matched."""
+    return _encode([match, rank, str(job_id)])
+
+
+def decode_rank_cursor(cursor: str) -> tuple[str, float, UUID]:
+    """Decode a token produced by `encode_rank_cursor`."""
+    try:
+        match, rank, job_id = _decode(cursor)
+        return str(match), float(rank), UUID(job_id)
+    except (ValueError, TypeError):
+        raise invalid_cursor()
+
+
+def encode_sync_token(
+    since: datetime | None, position: tuple[datetime, UUID] | None, synced_at: datetime
+) -> str:
+    """Encode a delta-sync position.
+
+    `since` is the lower bound of the sync in progress (None for a full
+    download), `position` the (changed_at, id) of the last change already
+    returned when more pages follow, and `synced_at` when the sync started.
+    """
+    changed_at, job_id = position or (None, None)
+    return _encode(
+        [
+            since.isoformat() if since else None,
+            changed_at.isoformat() if changed_at else None,
+            str(job_id) if job_id else None,
+            synced_at.isoformat(),
+        ]
+    )
+
+
+def decode_sync_token(
+    token: str,
+) -> tuple[datetime | None, tuple[datetime, UUID] | None, datetime]:
+    """Decode a token produced by `encode_sync_token`."""
+    try:
+        since, changed_at, job_id, synced_at = _decode(token)
+        position = None
+        if changed_at is not None:
+            position = (datetime.fromisoformat(changed_at), UUID(job_id))
+        return (
+            datetime.fromisoformat(since) if since is not None else None,
+            position,
+            datetime.fromisoformat(synced_at),
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid sync token"
+        )
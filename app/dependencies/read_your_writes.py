@@ -0,0 +1,107 @@
+from contextvars import ContextVar
+from typing import AsyncGenerator
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.dependencies.db import (
+    READ_YOUR_WRITES_SECONDS,
+    engine,
+    read_engine,
+    read_session_for,
+)
+from dotenv import load_dotenv
+import hashlib
+import hmac
+import math
+import os
+import time
+
+load_dotenv()
+
+# only worth doing when public reads can go to a lagging replica
+READ_YOUR_WRITES_ENABLED = read_engine is not engine and READ_YOUR_WRITES_SECONDS > 0
+LAST_WRITE_COOKIE = "last_write"
+MARKER_KEY = (os.getenv("SECRET_KEY") or "").encode()
+
+# {"recent": request carried a live marker, "wrote": request committed a write}
+_request_writes: ContextVar[dict | None] = ContextVar("request_writes", default=None)
+
+
+def _sign(expires: str) -> str:
+    return hmac.new(MARKER_KEY, expires.encode(), hashlib.sha256).hexdigest()[:32]
+
+
+def write_marker() -> str:
+    """Cookie value that pins reads to the primary for READ_YOUR_WRITES_SECONDS."""
+    expires = str(math.ceil(time.time() + READ_YOUR_WRITES_SECONDS))
+    return f"{expires}.{_sign(expires)}"
+
+
+def marker_is_live(marker: str | None) -> bool:
+    """True for an untampered marker whose window has not passed yet."""
+    if not marker:
+        return False
+    expires, _, signature = marker.partition(".")
+    if not (expires.isascii() and expires.isdigit()):
+        return False
+    if not hmac.compare_digest(signature.encode(), _sign(expires).encode()):
+        return False
+    # a signed marker never reaches further ahead than one window
+    return time.time() < int(expires) <= time.time() + READ_YOUR_WRITES_SECONDS + 1
+
+
+def record_write() -> None:
+    """Have the current response pin its client's reads to the primary."""
+    state = _request_writes.get()
+    if state is not None:
+        state["wrote"] = True
+
+
+def wrote_recently() -> bool:
+    """Whether the current request's client wrote within READ_YOUR_WRITES_SECONDS."""
+    state = _request_writes.get()
+    return state is not None and (state["recent"] or state["wrote"])
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Read-only session, on the replica unless the client has just written."""
+    async with read_session_for(wrote_recently()) as session:
+        yield session
+
+
+class ReadYourWritesMiddleware:
+    """Pure ASGI middleware carrying the read-your-writes window on the client.
+
+    A response to a request that wrote sets a signed, short-lived cookie;
+    requests presenting it read from the primary on any worker.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not READ_YOUR_WRITES_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        state = {
+            "recent": marker_is_live(HTTPConnection(scope).cookies.get(LAST_WRITE_COOKIE)),
+            "wrote": False,
+        }
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and state["wrote"]:
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{LAST_WRITE_COOKIE}={write_marker()}; "
+                    f"Max-Age={math.ceil(READ_YOUR_WRITES_SECONDS)}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        token = _request_writes.set(state)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_writes.reset(token)
@@ -0,0 +1,39 @@
+from typing import Any
+from fastapi import Response
+from pydantic import TypeAdapter
+
+_any = TypeAdapter(Any)
+
+
+def dump_json(value: Any) -> bytes:
+    """Compact UTF-8 JSON for plain data (dicts of UUIDs, datetimes, enums...)."""
+    return _any.dump_json(value)
+
+
+def to_jsonable(value: Any) -> Any:
+    """The JSON-compatible Python form of `value`, e.g. for CSV cells."""
+    return _any.dump_python(value, mode="json")
+
+
+def json_response(
+    value: Any, response: Response | None = None, status_code: int = 200
+) -> Response:
+    """Serialize already-trusted data straight to JSON bytes.
+
+    Returning a Response skips FastAPI's response_model validation and
+    jsonable_encoder pass; pydantic-core writes the same compact UTF-8 JSON.
+    Headers set on the injected `response` (e.g. ETag) are carried over.
+    """
+    headers = None
+    if response is not None:
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if key != "content-length"
+        }
+    return Response(
+        content=dump_json(value),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
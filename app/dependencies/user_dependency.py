@@ -1,13 +1,20 @@
 from typing import Annotated
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlmodel import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.dependencies.cache import profile_cache, token_cache
 from app.dependencies.db import get_session
+from app.dependencies.hashing import hash_password, verify_password
+from app.dependencies.idempotency import IdempotencyKeyHeader, idempotent_requests
+from app.dependencies.read_your_writes import get_read_session, record_write
 from ..models.user_model import Token, User, UserCreate, UserPublic, UserUpdate
-from pwdlib import PasswordHash
 from datetime import datetime, timezone, timedelta
+import hashlib
 import os
+import time
 import jwt
 from dotenv import load_dotenv
 
@@ -16,25 +23,48 @@ load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+# embed the public profile in access tokens and serve GET /user/ without the database
+PROFILE_FROM_TOKEN = os.getenv("PROFILE_FROM_TOKEN", "false").lower() == "true"
+# response header carrying the token that replaces the caller's after a profile update
+ACCESS_TOKEN_HEADER = "X-Access-Token"
 
-password_hash = PasswordHash.recommended()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="user/login")
 
 
-def get_username(token: Annotated[str, Depends(oauth2_scheme)]) -> str:
-    """Extract username from JWT token."""
-    credential_error = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+async def decode_token(token: str) -> dict:
+    """Verify `token` and return its claims, reusing earlier verifications."""
+    key = hashlib.sha256(token.encode()).hexdigest()
+    claims = await token_cache.get(key)
+    if claims is not None:
+        # the cache entry may outlive `exp` by a few milliseconds, so check it exactly
+        if claims["exp"] > time.time():
+            return claims
+        await token_cache.delete(key)
+
+    claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    if isinstance(claims.get("exp"), (int, float)):
+        await token_cache.set(key, claims, ttl=claims["exp"] - time.time())
+    return claims
+
+
+credential_error = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
 
+
+async def get_claims(token: Annotated[str, Depends(oauth2_scheme)]) -> dict:
+    """Verified claims of the bearer token."""
     try:
-        decoded_token = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        return await decode_token(token)
     except jwt.InvalidTokenError:
         raise credential_error
 
-    username = decoded_token.get("sub")
+
+async def get_username(claims: Annotated[dict, Depends(get_claims)]) -> str:
+    """Extract username from JWT token."""
+    username = claims.get("sub")
     if username is None:
         raise credential_error
     return username
@@ -42,13 +72,27 @@ def get_username(token: Annotated[str, Depends(oauth2_scheme)]) -> str:
 
 async def get_user(
     username: Annotated[str, Depends(get_username)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    claims: Annotated[dict, Depends(get_claims)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> UserPublic:
+    if PROFILE_FROM_TOKEN:
+        # update_user refreshes this worker's cache, other workers only see an
+        # update through the token it reissues; serve whichever copy is newer
+        candidates = [await profile_cache.get(username)]
+        if "profile" in claims:
+            candidates.append(UserPublic(**claims["profile"]))
+        candidates = [profile for profile in candidates if profile is not None]
+        if candidates:
+            return max(candidates, key=lambda profile: profile.updated_at)
+
     result = await session.execute(select(User).where(User.username == username))
     user = result.scalars().first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return UserPublic(**user.model_dump())
+    profile = UserPublic(**user.model_dump())
+    if PROFILE_FROM_TOKEN:
+        await profile_cache.set(username, profile)
+    return profile
 
 
 async def authenticate_user(
@@ -57,7 +101,7 @@ async def authenticate_user(
     """Check if username/password is correct."""
     result = await session.execute(select(User).where(User.username == username.lower()))
     user = result.scalars().first()
-    if user and password_hash.verify(password, user.hashed_password):
+    if user and await verify_password(password, user.hashed_password):
         return user
     return None
 
@@ -81,11 +125,19 @@ async def login(
         )
 
     expiry = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    token = generate_token({"sub": user.username, "exp": int(expiry.timestamp())})
+    token = access_token(user, int(expiry.timestamp()))
 
     return Token(access_token=token, token_type="bearer")
 
 
+def access_token(user: User, expiry: int) -> str:
+    """Access token for `user`, carrying the profile when PROFILE_FROM_TOKEN is on."""
+    payload = {"sub": user.username, "exp": expiry}
+    if PROFILE_FROM_TOKEN:
+        payload["profile"] = UserPublic(**user.model_dump()).model_dump(mode="json")
+    return generate_token(payload)
+
+
 async def get_existing_user(session: AsyncSession, username: str) -> User | None:
     return (
         (await session.execute(select(User).where(User.username == username)))
@@ -94,44 +146,66 @@ async def get_existing_user(session: AsyncSession, username: str) -> User | None
     )
 
 
+def violated_constraint(error: IntegrityError) -> str:
+    """Name of the constraint behind an IntegrityError (asyncpg), or its message."""
+    cause = getattr(error.orig, "__cause__", None)
+    return getattr(cause, "constraint_name", None) or str(error.orig)
+
+
 async def register(
-    session: Annotated[AsyncSession, Depends(get_session)], user: UserCreate
+    session: Annotated[AsyncSession, Depends(get_session)],
+    user: UserCreate,
+    idempotency_key: IdempotencyKeyHeader = None,
 ) -> UserPublic:
-    try:
-        # Check username
-        existing_user = await get_existing_user(session, user.username)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT, detail="Username already exists"
-            )
-
-        # Check email (optional)
-        existing_email = (
-            (await session.execute(select(User).where(User.email == user.email)))
-            .scalars()
-            .first()
+    if idempotency_key:
+        # replays skip the password hash along with the insert
+        return await idempotent_requests.run(
+            f"register:{user.username.lower()}:{idempotency_key}",
+            user,
+            status.HTTP_201_CREATED,
+            lambda: insert_user(session, user),
         )
-        if existing_email:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT, detail="Email already registered"
-            )
+    return await insert_user(session, user)
+
 
+async def insert_user(session: AsyncSession, user: UserCreate) -> UserPublic:
+    try:
         val_user = User(
             full_name=user.full_name,
             email=user.email,
             username=user.username.lower(),
-            hashed_password=password_hash.hash(user.password),
+            hashed_password=await hash_password(user.password),
         )
 
-        session.add(val_user)
+        # a taken username inserts nothing; a taken email violates ix_users_email
+        statement = (
+            pg_insert(User)
+            .values(**val_user.model_dump())
+            .on_conflict_do_nothing(index_elements=[User.username])
+            .returning(User)
+        )
+        new_user = (await session.execute(statement)).scalars().first()
+        if not new_user:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Username already exists"
+            )
         await session.commit()
-        await session.refresh(val_user)
 
-        return UserPublic(**val_user.model_dump())
+        return UserPublic(**new_user.model_dump())
 
     except HTTPException:
         # Re-raise intentional HTTP errors
         raise
+    except IntegrityError as e:
+        await session.rollback()
+        if "email" in violated_constraint(e):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Email already registered"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Registration failed: {str(e)}",
+        )
     except Exception as e:
         await session.rollback()
         raise HTTPException(
@@ -144,6 +218,8 @@ async def update_user(
     session: Annotated[AsyncSession, Depends(get_session)],
     user: UserUpdate,
     username: Annotated[str, Depends(get_username)],
+    claims: Annotated[dict, Depends(get_claims)],
+    response: Response,
 ) -> UserPublic:
     try:
         existing_user = await get_existing_user(session, username)
@@ -157,8 +233,20 @@ async def update_user(
         session.add(existing_user)
         await session.commit()
         await session.refresh(existing_user)
+        record_write()
 
-        return UserPublic(**existing_user.model_dump())
+        profile = UserPublic(**existing_user.model_dump())
+        # the caller's token names the old username and, with PROFILE_FROM_TOKEN,
+        # carries the old profile on every worker; hand out a replacement that
+        # expires when the old one would have
+        response.headers[ACCESS_TOKEN_HEADER] = access_token(existing_user, claims["exp"])
+        if PROFILE_FROM_TOKEN:
+            # the old token stays valid, so this worker keeps the fresh profile
+            # for as long as such a token can live
+            await profile_cache.set(
+                username, profile, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60
+            )
+        return profile
 
     except HTTPException:
         raise
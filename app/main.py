@@ -1,15 +1,23 @@
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
-from .dependencies.db import create_db_and_tables
-from app.routers import user_router, job_router
+from .dependencies.db import check_schema_version
+from .dependencies.job_events import job_events
+from .dependencies.metrics import MetricsMiddleware
+from .dependencies.read_your_writes import ReadYourWritesMiddleware
+from app.routers import user_router, job_router, internal_router, metrics_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await create_db_and_tables()
+    await check_schema_version()
     yield
+    await job_events.stop()
 
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.include_router(user_router.router, prefix="/user", tags=["user"])
 app.include_router(job_router.router, prefix="/jobs", tags=["jobs"])
+app.include_router(internal_router.router)
+app.include_router(metrics_router.router)
@@ -0,0 +1,16 @@
+from datetime import datetime
+from sqlalchemy import Column, Text
+from sqlmodel import Field as SQLField
+from sqlmodel import SQLModel
+
+
+class IdempotencyKey(SQLModel, table=True):
+    """Response stored for an `Idempotency-Key`; in progress while `status_code` is null."""
+
+    __tablename__ = "idempotency_keys"
+    key: str = SQLField(primary_key=True)
+    fingerprint: str
+    status_code: int | None = None
+    body: str | None = SQLField(default=None, sa_column=Column(Text))
+    created_at: datetime = SQLField(default_factory=datetime.utcnow)
+    expires_at: datetime = SQLField(index=True)
@@ -1,13 +1,31 @@
 from sqlmodel import Field
+from datetime import datetime, timezone
 from enum import Enum
+from typing import Annotated, Literal
 from uuid import UUID
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, BeforeValidator, Field, model_validator
 from sqlmodel import Field as SQLField
+from sqlmodel import SQLModel
+from sqlalchemy import DDL, Index, event, text
 
+from app.dependencies.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.models.timestamps import TimeStamps
 
 
+def to_naive_utc(value: datetime) -> datetime:
+    # created_at / updated_at are stored as naive UTC
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+NaiveUTCDatetime = Annotated[datetime, AfterValidator(to_naive_utc)]
+
+# full-text document of a job; queries must use this exact expression to hit ix_jobs_search
+JOB_SEARCH_VECTOR = "to_tsvector('simple', company || ' ' || position)"
+
+
 class JobStatus(str, Enum):
     interviewed = "interviewed"
     declined = "declined"
@@ -16,6 +34,43 @@ class JobStatus(str, Enum):
 
 class Job(TimeStamps, table=True):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # keyset pagination: ORDER BY (created_at, id)
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        Index("ix_jobs_createdBy_created_at_id", "createdBy", "created_at", "id"),
+        # filtered listings: equality columns first, then the keyset
+        Index("ix_jobs_status_created_at_id", "status", "created_at", "id"),
+        Index(
+            "ix_jobs_createdBy_status_created_at",
+            "createdBy",
+            "status",
+            "created_at",
+            "id",
+        ),
+        # conditional GETs and change feeds on a user's jobs
+        Index("ix_jobs_createdBy_updated_at", "createdBy", "updated_at"),
+        # prefix (LIKE 'abc%') lookups regardless of database collation
+        Index(
+            "ix_jobs_company_prefix",
+            "company",
+            postgresql_ops={"company": "varchar_pattern_ops"},
+        ),
+        Index(
+            "ix_jobs_position_prefix",
+            "position",
+            postgresql_ops={"position": "varchar_pattern_ops"},
+        ),
+        # full-text search and typo-tolerant company lookups
+        Index(
+            "ix_jobs_search", text(JOB_SEARCH_VECTOR), postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_jobs_company_trgm",
+            "company",
+            postgresql_using="gin",
+            postgresql_ops={"company": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
     id: UUID = SQLField(default_factory=uuid4, primary_key=True)
     company: str
     position: str
@@ -23,6 +78,35 @@ class Job(TimeStamps, table=True):
     status: JobStatus = Field(default=JobStatus.pending)
 
 
+event.listen(
+    Job.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+class JobStats(SQLModel, table=True):
+    """Per-user job counts by status, maintained by every job write."""
+
+    __tablename__ = "job_stats"
+    username: str = SQLField(primary_key=True)
+    pending: int = 0
+    interviewed: int = 0
+    declined: int = 0
+
+
+class JobTombstone(SQLModel, table=True):
+    """Id of a deleted job, kept for delta sync until purged."""
+
+    __tablename__ = "job_tombstones"
+    __table_args__ = (
+        Index("ix_job_tombstones_createdBy_deleted_at_id", "createdBy", "deleted_at", "id"),
+    )
+    id: UUID = SQLField(primary_key=True)
+    createdBy: str
+    deleted_at: datetime = SQLField(default_factory=datetime.utcnow)
+
+
 class JobBase(BaseModel):
     company: str = Field(max_length=50, min_length=2, pattern=r"^[a-z A-Z]+$")
     position: str = Field(max_length=50, min_length=3, pattern=r"^[a-z A-Z]+$")
@@ -37,3 +121,101 @@ class JobUpdate(JobBase):
     )
     status: JobStatus | None = None
 
+
+class JobPage(BaseModel):
+    items: list[Job]
+    next_cursor: str | None = None
+
+
+# response field order of a job, shared by the column-projected read paths
+JOB_FIELDS = list(Job.model_fields)
+
+
+def parse_fields(value):
+    """Accept `fields=id,company` as well as repeated `fields` parameters."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = [value]
+    names = [name.strip() for item in value for name in item.split(",") if name.strip()]
+    unknown = sorted(set(names) - set(JOB_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return names or None
+
+
+SparseFields = Annotated[
+    list[str] | None,
+    BeforeValidator(parse_fields),
+    Field(description="Comma-separated job fields to return (default: all)"),
+]
+
+
+class JobFilters(BaseModel):
+    status: JobStatus | None = None
+    company: str | None = Field(default=None, max_length=50, description="Company name prefix")
+    position: str | None = Field(default=None, max_length=50, description="Position prefix")
+    created_after: NaiveUTCDatetime | None = None
+    created_before: NaiveUTCDatetime | None = None
+    order: Literal["asc", "desc"] = "asc"
+
+
+class JobListQuery(JobFilters):
+    cursor: str | None = None
+    limit: int = Field(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    fields: SparseFields = None
+
+
+class JobExportQuery(JobFilters):
+    format: Literal["ndjson", "csv"] = "ndjson"
+    fields: SparseFields = None
+
+
+class JobSelection(BaseModel):
+    # an explicit empty list is rejected rather than read as "no id criterion"
+    ids: list[UUID] | None = Field(default=None, min_length=1)
+    status: JobStatus | None = None
+    created_after: NaiveUTCDatetime | None = None
+    created_before: NaiveUTCDatetime | None = None
+
+    @model_validator(mode="after")
+    def require_criteria(self):
+        # an empty selection would match every job of the user
+        filters = (self.status, self.created_after, self.created_before)
+        if self.ids is None and all(value is None for value in filters):
+            raise ValueError("Provide ids or at least one filter")
+        return self
+
+
+class JobBulkUpdate(BaseModel):
+    where: JobSelection
+    status: JobStatus
+
+
+class JobBulkResult(BaseModel):
+    count: int
+    ids: list[UUID]
+
+
+class JobSearchQuery(BaseModel):
+    q: str = Field(min_length=1, max_length=100, description="Words or word prefixes")
+    cursor: str | None = None
+    limit: int = Field(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+
+
+class JobSearchPage(JobPage):
+    match: Literal["fulltext", "trigram"] = "fulltext"
+
+
+class JobChangesQuery(BaseModel):
+    since: str | None = Field(
+        default=None, description="Sync token from the previous response (omit for a full sync)"
+    )
+    limit: int = Field(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+
+
+class JobChanges(BaseModel):
+    items: list[Job]
+    deleted: list[UUID]
+    next_token: str
+    has_more: bool
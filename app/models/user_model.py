@@ -13,7 +13,7 @@ class User(TimeStamps, table=True):
     __tablename__ = 'users'
     id: UUID = SQLField(default_factory = uuid4, primary_key=True)
     full_name: str
-    email: EmailStr 
+    email: EmailStr = SQLField(index=True, unique=True)
     username: str = SQLField(index=True, unique=True)
     hashed_password: str
 
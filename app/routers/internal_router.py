@@ -0,0 +1,105 @@
+from fastapi import APIRouter, Depends, status
+from app.dependencies.cache import job_cache, profile_cache, token_cache
+from app.dependencies.db import engine, pool_stats
+from app.dependencies.hashing import hashing_pool
+from app.dependencies.idempotency import idempotent_requests
+from app.dependencies.internal_dependency import require_internal_token
+from app.dependencies.job_events import job_events
+
+# operator-only: token protected and left out of the public OpenAPI schema
+router = APIRouter(
+    prefix="/internal",
+    dependencies=[Depends(require_internal_token)],
+    include_in_schema=False,
+)
+
+
+@router.get(
+    "/cache",
+    summary="Cache statistics",
+    description="""
+### 📊 Cache Statistics
+Hit, miss and eviction counters of the public job read cache, the verified
+token cache and the user profile cache.
+    """,
+    status_code=status.HTTP_200_OK,
+    tags=["internal"],
+)
+async def cache_stats() -> dict:
+    """
+    Return the counters of the in-process caches.
+    """
+    return {
+        "jobs": job_cache.stats(),
+        "tokens": token_cache.stats(),
+        "profiles": profile_cache.stats(),
+    }
+
+
+@router.get(
+    "/hashing",
+    summary="Password hashing pool statistics",
+    description="""
+### 📊 Hashing Pool Statistics
+Queue depth, rejections and execution time of the argon2 worker pool.
+    """,
+    status_code=status.HTTP_200_OK,
+    tags=["internal"],
+)
+async def hashing_stats() -> dict:
+    """
+    Return the counters of the password hashing pool.
+    """
+    return hashing_pool.stats()
+
+
+@router.get(
+    "/db/pool",
+    summary="Database connection pool statistics",
+    description="""
+### 📊 Connection Pool Statistics
+Checked-out and idle connections, overflow and checkout wait times.
+    """,
+    status_code=status.HTTP_200_OK,
+    tags=["internal"],
+)
+async def db_pool_stats() -> dict:
+    """
+    Return the state of the database connection pool.
+    """
+    return pool_stats(engine.pool)
+
+
+@router.get(
+    "/events",
+    summary="Live job update statistics",
+    description="""
+### 📊 Live Update Statistics
+LISTEN connection state, connected subscribers, delivered events and resyncs.
+    """,
+    status_code=status.HTTP_200_OK,
+    tags=["internal"],
+)
+async def job_event_stats() -> dict:
+    """
+    Return the state of this worker's job event broker.
+    """
+    return job_events.stats()
+
+
+@router.get(
+    "/idempotency",
+    summary="Idempotency key statistics",
+    description="""
+### 📊 Idempotency Statistics
+Store backend, requests executed, responses replayed and duplicates that
+waited for, or disagreed with, the request that first used their key.
+    """,
+    status_code=status.HTTP_200_OK,
+    tags=["internal"],
+)
+async def idempotency_stats() -> dict:
+    """
+    Return the counters of this worker's idempotent request handling.
+    """
+    return idempotent_requests.stats()
@@ -1,9 +1,21 @@
+from typing import Annotated
 from uuid import UUID
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.dependencies.db import get_session
-from app.models.job_model import Job, JobBase, JobUpdate
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
+from app.models.job_model import (
+    Job,
+    JobBase,
+    JobBulkResult,
+    JobChanges,
+    JobExportQuery,
+    JobPage,
+    JobSearchPage,
+    JobStats,
+    JobUpdate,
+)
 from app.dependencies import job_dependency
+from app.dependencies.serialization import json_response
+from app.dependencies.user_dependency import get_claims, get_username
 
 router = APIRouter(
     prefix="/jobs",
@@ -19,12 +31,18 @@ router = APIRouter(
 ### 🧾 Create Job Post
 Create a new job posting.  
 Only authenticated users can create jobs.
+
+Send an `Idempotency-Key` header to make retries safe: a repeated request
+with the same key returns the first response (marked `Idempotent-Replayed: true`)
+instead of creating another job.
     """,
     status_code=status.HTTP_201_CREATED,
     responses={
         201: {"description": "Job created successfully"},
         400: {"description": "Bad request — invalid job data"},
         401: {"description": "Unauthorized — invalid or missing token"},
+        409: {"description": "Conflict — a request with this Idempotency-Key is still in progress"},
+        422: {"description": "Unprocessable — Idempotency-Key reused with a different job"},
         500: {"description": "Internal server error — failed to create job"},
     },
     tags=["private"],
@@ -36,6 +54,89 @@ async def create_job(add_job: Job = Depends(job_dependency.create_job)):
     return add_job
 
 
+@router.post(
+    "/bulk",
+    response_model=list[Job],
+    summary="Create many job posts at once",
+    description="""
+### 📦 Bulk Create Jobs
+Create a batch of job postings in a single transaction.  
+Every item is validated before anything is written; the created jobs are
+returned in the same order as the request.
+    """,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        201: {"description": "Jobs created successfully"},
+        401: {"description": "Unauthorized — invalid or missing token"},
+        422: {"description": "Validation error — see the index of each invalid item"},
+        500: {"description": "Internal server error — failed to create jobs"},
+    },
+    tags=["private"],
+)
+async def create_jobs(add_jobs: list[dict] = Depends(job_dependency.create_jobs)):
+    """
+    Create several job listings associated with the logged-in user.
+    """
+    return json_response(add_jobs, status_code=status.HTTP_201_CREATED)
+
+
+@router.patch(
+    "/bulk",
+    response_model=JobBulkResult,
+    summary="Update the status of many jobs",
+    description="""
+### ✏️ Bulk Update Jobs
+Set a new `status` on your jobs selected by `ids` and/or by status and a
+`created_at` range.  
+Only jobs you created are affected; their ids are returned.
+    """,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Jobs updated successfully"},
+        400: {"description": "Bad request — too many ids"},
+        401: {"description": "Unauthorized — invalid or missing token"},
+        422: {"description": "Validation error — empty selection"},
+        500: {"description": "Internal server error — failed to update jobs"},
+    },
+    tags=["private"],
+)
+async def update_jobs(
+    jobs_update: JobBulkResult = Depends(job_dependency.update_jobs),
+):
+    """
+    Update the status of all selected jobs owned by the logged-in user.
+    """
+    return jobs_update
+
+
+@router.delete(
+    "/bulk",
+    response_model=JobBulkResult,
+    summary="Delete many jobs",
+    description="""
+### 🗑️ Bulk Delete Jobs
+Delete your jobs selected by `ids` and/or by status and a `created_at` range.  
+Only jobs you created are affected; their ids are returned.
+    """,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Jobs deleted successfully"},
+        400: {"description": "Bad request — too many ids"},
+        401: {"description": "Unauthorized — invalid or missing token"},
+        422: {"description": "Validation error — empty selection"},
+        500: {"description": "Internal server error — failed to delete jobs"},
+    },
+    tags=["private"],
+)
+async def delete_jobs(
+    jobs_delete: JobBulkResult = Depends(job_dependency.delete_jobs),
+):
+    """
+    Delete all selected jobs owned by the logged-in user.
+    """
+    return jobs_delete
+
+
 @router.patch(
     "/{job_id}",
     response_model=Job,
@@ -97,50 +198,236 @@ async def delete_job(
 
 @router.get(
     "/",
-    response_model=list[Job],
+    response_model=JobPage,
     summary="Get all job listings",
     description="""
 ### 📋 Get All Jobs
-Retrieve all available job postings.  
+Retrieve available job postings, one page at a time.  
+Filter by `status`, `company` / `position` prefix or a `created_at` range,
+and choose the sort `order` (`asc` or `desc`).  
+Use `fields` (e.g. `fields=id,company,status`) to return only some columns.  
+Pass the returned `next_cursor` as `cursor` to fetch the next page.  
 This endpoint is public and does not require authentication.
     """,
     status_code=status.HTTP_200_OK,
     responses={
         200: {"description": "Jobs retrieved successfully"},
+        400: {"description": "Bad request — invalid cursor"},
         500: {"description": "Internal server error — failed to load jobs"},
     },
     tags=["public"],
 )
-async def get_jobs(read_jobs: list[Job] = Depends(job_dependency.get_jobs)):
+async def get_jobs(read_jobs: dict = Depends(job_dependency.get_jobs)):
     """
-    Get a list of all job postings in the system.
+    Get a page of job postings ordered by creation time.
     """
-    return read_jobs
+    return json_response(read_jobs)
 
 
 @router.get(
     "/user",
-    response_model=list[Job],
+    response_model=JobPage,
     summary="Get jobs created by the logged-in user",
     description="""
 ### 👤 My Jobs
-Retrieve all jobs posted by the authenticated user.
+Retrieve jobs posted by the authenticated user, one page at a time.  
+Accepts the same filters, sort `order` and `fields` as the public listing.  
+Pass the returned `next_cursor` as `cursor` to fetch the next page.  
+Send the returned `ETag` in `If-None-Match` to revalidate cheaply.
     """,
     status_code=status.HTTP_200_OK,
     responses={
         200: {"description": "User jobs retrieved successfully"},
+        304: {"description": "Not modified — the client copy is current"},
+        400: {"description": "Bad request — invalid cursor"},
         401: {"description": "Unauthorized — invalid or missing token"},
         500: {"description": "Internal server error — failed to load jobs"},
     },
     tags=["private"],
 )
 async def get_user_jobs(
-    read_jobs: list[Job] = Depends(job_dependency.get_user_jobs),
+    response: Response,
+    read_jobs: dict = Depends(job_dependency.get_user_jobs),
+):
+    """
+    Retrieve a page of job postings created by the authenticated user.
+    """
+    return json_response(read_jobs, response)
+
+
+@router.get(
+    "/user/changes",
+    response_model=JobChanges,
+    summary="Changes to the logged-in user's jobs since the last sync",
+    description="""
+### 🔄 Sync My Jobs
+Jobs created or updated since `since`, plus the ids of deleted jobs, oldest
+change first.  
+Omit `since` for a full download, then pass the returned `next_token` as
+`since` on the next call. While `has_more` is true, call again right away.  
+A change can be sent twice around a sync boundary, so apply items and
+deletions idempotently. `410` means the token is too old: download the full
+list again.
+    """,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Changes retrieved successfully"},
+        400: {"description": "Bad request — invalid sync token"},
+        401: {"description": "Unauthorized — invalid or missing token"},
+        410: {"description": "Gone — sync token older than the tombstone retention"},
+        500: {"description": "Internal server error — failed to load changes"},
+    },
+    tags=["private"],
+)
+async def get_user_job_changes(
+    changes: dict = Depends(job_dependency.get_user_job_changes),
+):
+    """
+    Return the changes to the authenticated user's jobs since a sync token.
+    """
+    return json_response(changes)
+
+
+@router.get(
+    "/stats",
+    response_model=JobStats,
+    summary="Job counts of the logged-in user",
+    description="""
+### 📊 My Job Stats
+Number of your jobs in each status (pending, interviewed, declined).
+    """,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Job stats retrieved successfully"},
+        401: {"description": "Unauthorized — invalid or missing token"},
+        500: {"description": "Internal server error — failed to load stats"},
+    },
+    tags=["private"],
+)
+async def get_job_stats(stats: JobStats = Depends(job_dependency.read_job_stats)):
+    """
+    Return the per-status job counts of the authenticated user.
+    """
+    return stats
+
+
+@router.get(
+    "/search",
+    response_model=JobSearchPage,
+    summary="Search job listings",
+    description="""
+### 🔎 Search Jobs
+Full-text search over company and position, ranked by relevance.  
+Every word in `q` also matches as a prefix (`eng` finds `Engineer`).  
+When nothing matches, similar company names are returned instead and
+`match` is `trigram`.  
+Pass the returned `next_cursor` as `cursor` to fetch the next page.
+    """,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Search results retrieved successfully"},
+        400: {"description": "Bad request — invalid cursor"},
+        500: {"description": "Internal server error — search failed"},
+    },
+    tags=["public"],
+)
+async def search_jobs(results: dict = Depends(job_dependency.search_jobs)):
+    """
+    Search job postings by company and position.
+    """
+    return json_response(results)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all job listings",
+    description="""
+### 📤 Export Jobs
+Stream every job posting matching the filters as NDJSON (`format=ndjson`)
+or CSV (`format=csv`).  
+Use `fields` to export only some columns.  
+Rows are sent as they are read, so large exports start immediately.
+    """,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {
+            "description": "Jobs streamed successfully",
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+        500: {"description": "Internal server error — failed to export jobs"},
+    },
+    tags=["public"],
+)
+async def export_jobs(query: Annotated[JobExportQuery, Query()]):
+    """
+    Stream all job postings matching the filters.
+    """
+    return job_dependency.export_jobs(query)
+
+
+@router.get(
+    "/user/export",
+    response_class=StreamingResponse,
+    summary="Export jobs created by the logged-in user",
+    description="""
+### 📤 Export My Jobs
+Stream the authenticated user's job postings as NDJSON or CSV.  
+Accepts the same filters and `fields` as the public export.
+    """,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {
+            "description": "User jobs streamed successfully",
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+        401: {"description": "Unauthorized — invalid or missing token"},
+        500: {"description": "Internal server error — failed to export jobs"},
+    },
+    tags=["private"],
+)
+async def export_user_jobs(
+    query: Annotated[JobExportQuery, Query()],
+    username: Annotated[str, Depends(get_username)],
+):
+    """
+    Stream the job postings created by the authenticated user.
+    """
+    return job_dependency.export_user_jobs(username, query)
+
+
+@router.get(
+    "/user/stream",
+    response_class=StreamingResponse,
+    summary="Live changes to the logged-in user's jobs",
+    description="""
+### 🔴 Live Job Updates
+Server-Sent Events stream of `created`, `updated` and `deleted` events for
+your jobs; each event's data is `{"op": ..., "ids": [...]}`.  
+A `resync` event means some events were missed: reload the list, then keep
+listening. Idle streams receive a keepalive comment every few seconds.  
+The stream ends with an `expired` event when the access token expires;
+reconnect with a fresh token.
+    """,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {
+            "description": "Event stream opened",
+            "content": {"text/event-stream": {}},
+        },
+        401: {"description": "Unauthorized — invalid or missing token"},
+        503: {"description": "Service unavailable — live updates are not available"},
+    },
+    tags=["private"],
+)
+async def stream_user_jobs(
+    username: Annotated[str, Depends(get_username)],
+    claims: Annotated[dict, Depends(get_claims)],
 ):
     """
-    Retrieve all job postings created by the authenticated user.
+    Push changes to the authenticated user's jobs as they are committed.
     """
-    return read_jobs
+    return await job_dependency.stream_user_jobs(username, claims.get("exp"))
 
 
 @router.get(
@@ -149,11 +436,13 @@ async def get_user_jobs(
     summary="Get job details by ID",
     description="""
 ### 🔍 Get Job Details
-Retrieve details of a specific job posting using its unique ID.
+Retrieve details of a specific job posting using its unique ID.  
+Send the returned `ETag` in `If-None-Match` to revalidate cheaply.
     """,
     status_code=status.HTTP_200_OK,
     responses={
         200: {"description": "Job details retrieved successfully"},
+        304: {"description": "Not modified — the client copy is current"},
         404: {"description": "Job not found"},
         500: {"description": "Internal server error"},
     },
@@ -161,9 +450,9 @@ Retrieve details of a specific job posting using its unique ID.
 )
 async def get_job(
     job_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    read_job: Job = Depends(job_dependency.read_job),
 ):
     """
     Retrieve detailed information for a single job by its unique identifier.
     """
-    return await job_dependency.get_job(session, job_id)
+    return read_job
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import PlainTextResponse
+from app.dependencies.internal_dependency import require_internal_token
+from app.dependencies.metrics import render_metrics
+
+# operator-only, guarded like /internal
+router = APIRouter(
+    dependencies=[Depends(require_internal_token)],
+    include_in_schema=False,
+)
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus metrics",
+    description="""
+### 📈 Metrics
+Per-route request counts, latency histograms, in-flight requests and SQL
+statement counts and time per request, in the Prometheus text format.
+    """,
+    status_code=status.HTTP_200_OK,
+    tags=["internal"],
+)
+async def metrics() -> PlainTextResponse:
+    """
+    Return the collected metrics for Prometheus to scrape.
+    """
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
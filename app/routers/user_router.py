@@ -15,13 +15,19 @@ router = APIRouter(
 ### 🧾 Register a New User
 This endpoint allows a new user to create an account.  
 Provide a full name, email, username, and password.
+
+Send an `Idempotency-Key` header to make retries safe: a repeated request
+with the same key returns the first response (marked `Idempotent-Replayed: true`)
+instead of failing with 409.
     """,
     status_code=status.HTTP_201_CREATED,
     responses={
         201: {"description": "User registered successfully"},
         400: {"description": "Bad request — invalid input data"},
-        409: {"description": "Conflict — username or email already exists"},
+        409: {"description": "Conflict — username or email already exists, or a request with this Idempotency-Key is still in progress"},
+        422: {"description": "Unprocessable — Idempotency-Key reused with a different registration"},
         500: {"description": "Internal server error — registration failed"},
+        503: {"description": "Service unavailable — too many concurrent requests"},
     },
     tags=['public']
 )
@@ -47,6 +53,7 @@ Provide your credentials (username and password) to obtain an access token.
         200: {"description": "Login successful — access token returned"},
         401: {"description": "Unauthorized — invalid username or password"},
         500: {"description": "Internal server error — authentication failed"},
+        503: {"description": "Service unavailable — too many concurrent requests"},
     },
     tags=['public']
 )
@@ -93,10 +100,22 @@ async def get_user(
 ### ✏️ Update User Profile
 Update your user information.  
 You can modify your name, email, or username.
+
+The response carries a replacement access token in the `X-Access-Token`
+header; use it from now on, since the old token still names the old
+username and profile.
     """,
     status_code=status.HTTP_200_OK,
     responses={
-        200: {"description": "User updated successfully"},
+        200: {
+            "description": "User updated successfully",
+            "headers": {
+                "X-Access-Token": {
+                    "description": "Access token reflecting the updated profile",
+                    "schema": {"type": "string"},
+                }
+            },
+        },
         400: {"description": "Bad request — invalid input"},
         401: {"description": "Unauthorized — invalid or expired token"},
         404: {"description": "User not found"},
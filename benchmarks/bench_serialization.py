@@ -0,0 +1,73 @@
+"""Micro-benchmark: response_model serialization vs. json_response for job pages.
+
+Usage: python -m benchmarks.bench_serialization [--repeat N]
+"""
+
+import argparse
+import asyncio
+import time
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from app.dependencies.serialization import json_response
+from app.models.job_model import JOB_FIELDS, Job, JobPage, JobStatus
+
+PAGE_SIZES = (1_000, 10_000)
+
+
+def make_page(size: int) -> dict:
+    """A page as the list endpoints build it: job_rows() dicts in JOB_FIELDS order."""
+    jobs = (
+        Job(
+            company=f"Company {i}",
+            position="Backend Engineer",
+            createdBy=f"user{i % 100}",
+            status=list(JobStatus)[i % len(JobStatus)],
+        )
+        for i in range(size)
+    )
+    rows = [{name: getattr(job, name) for name in JOB_FIELDS} for job in jobs]
+    return {"items": rows, "next_cursor": "cursor"}
+
+
+async def default_path(field, page: dict) -> bytes:
+    """What FastAPI does for `response_model=JobPage`: validate, encode, json.dumps."""
+    content = await serialize_response(field=field, response_content=page, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+def fast_path(page: dict) -> bytes:
+    return json_response(page).body
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    field = create_model_field(name="Response", type_=JobPage, mode="serialization")
+    loop = asyncio.new_event_loop()
+    print(f"{'rows':>7} {'response_model ms':>18} {'json_response ms':>17} {'speedup':>8}")
+    for size in PAGE_SIZES:
+        page = make_page(size)
+        expected = loop.run_until_complete(default_path(field, page))
+        if fast_path(page) != expected:
+            raise SystemExit(f"output differs for {size} rows")
+
+        slow = best_of(args.repeat, lambda: loop.run_until_complete(default_path(field, page)))
+        fast = best_of(args.repeat, lambda: fast_path(page))
+        print(f"{size:>7} {slow * 1000:>18.1f} {fast * 1000:>17.1f} {slow / fast:>7.1f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,680 @@
+"""Load benchmark: every job_router and user_router route against a seeded Postgres.
+
+Usage:
+    python -m benchmarks.load [--users N] [--jobs N] [--requests N] [--concurrency N]
+    python -m benchmarks.load --save-baseline benchmarks/baseline.json
+    python -m benchmarks.load --baseline benchmarks/baseline.json [--threshold 0.2]
+
+The database comes from --database-url (or BENCH_DATABASE_URL). Without one,
+an embedded Postgres is started with the optional `pgserver` package. The
+database is migrated, TRUNCATED and reseeded, so only point this at a
+scratch database.
+
+Requests go in-process through httpx's ASGI transport unless --base-url
+names a running server (which must use the same database).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+from uuid import UUID, uuid4
+
+SEED = 1234
+BENCH_PASSWORD = "benchPassword1"
+COPY_CHUNK_SIZE = 50_000
+WORDS = (
+    "Acme Apex Blue Bright Cedar Cloud Delta Echo Falcon Global Harbor Iron "
+    "Jade Keystone Lumen Maple Nova Orbit Pine Quantum River Summit Terra "
+    "Union Vertex Willow Zenith Labs Systems Works Partners Group"
+).split()
+POSITIONS = (
+    "Backend Engineer",
+    "Frontend Engineer",
+    "Data Engineer",
+    "Product Manager",
+    "Site Reliability Engineer",
+    "Designer",
+    "Data Scientist",
+    "Support Engineer",
+)
+STATUSES = ("pending", "interviewed", "declined")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"))
+    parser.add_argument("--data-dir", help="pgserver data directory (default: a temp dir)")
+    parser.add_argument("--base-url", help="benchmark a running server instead of in-process")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=500, help="requests per route")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--skip-seed", action="store_true", help="reuse the seeded data")
+    parser.add_argument("--output", default="benchmarks/results.json")
+    parser.add_argument("--baseline", help="fail when results regress against this file")
+    parser.add_argument("--save-baseline", help="also write the results to this file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed relative regression of p95/p99 latency and throughput",
+    )
+    args = parser.parse_args()
+    if not 1 <= args.jobs <= 1_000_000:
+        parser.error("--jobs must be between 1 and 1000000")
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+    return args
+
+
+def start_database(args: argparse.Namespace):
+    """Return (async database URL, embedded server or None)."""
+    if args.database_url:
+        return args.database_url, None
+    try:
+        import pgserver
+    except ImportError:
+        raise SystemExit(
+            "No database: pass --database-url / BENCH_DATABASE_URL "
+            "or `pip install pgserver` for an embedded Postgres."
+        )
+    from sqlalchemy.engine import make_url
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="job-api-bench-")
+    server = pgserver.get_server(data_dir, cleanup_mode="stop")
+    url = make_url(server.get_uri()).set(drivername="postgresql+asyncpg")
+    return url.render_as_string(hide_password=False), server
+
+
+async def trigram_installable(url: str) -> bool:
+    """Whether the server ships pg_trgm (some embedded Postgres builds do not)."""
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(url)
+    try:
+        async with engine.connect() as conn:
+            return bool(
+                await conn.scalar(
+                    text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+                )
+            )
+    finally:
+        await engine.dispose()
+
+
+def skip_trigram_ddl(conn, cursor, statement, parameters, context, executemany):
+    # turns the pg_trgm extension and its index into no-ops during migrate()
+    if "pg_trgm" in statement or "gin_trgm_ops" in statement:
+        return "SELECT 1", ()
+    return statement, parameters
+
+
+def migrate(trigram: bool) -> None:
+    """Upgrade to head; without pg_trgm, skip only the trigram extension and index.
+
+    The misspelling fallback of search depends on them, so the search
+    scenario leaves out its misspelt queries in that case.
+    """
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    from app.dependencies.db import ALEMBIC_CONFIG
+
+    if trigram:
+        command.upgrade(Config(str(ALEMBIC_CONFIG)), "head")
+        return
+    print(
+        "pg_trgm is not available: migrating without the trigram index; "
+        "search is benchmarked without its misspelling fallback",
+        file=sys.stderr,
+    )
+    event.listen(Engine, "before_cursor_execute", skip_trigram_ddl, retval=True)
+    try:
+        command.upgrade(Config(str(ALEMBIC_CONFIG)), "head")
+    finally:
+        event.remove(Engine, "before_cursor_execute", skip_trigram_ddl)
+
+
+def company_name(rng: random.Random) -> str:
+    return f"{rng.choice(WORDS)} {rng.choice(WORDS)}"
+
+
+def job_records(users: list[str], count: int, rng: random.Random):
+    """Deterministic job rows spread over the last year, in COPY column order."""
+    now = datetime.utcnow()
+    for _ in range(count):
+        created_at = now - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+        yield (
+            created_at,
+            created_at,
+            UUID(int=rng.getrandbits(128), version=4),
+            company_name(rng),
+            rng.choice(POSITIONS),
+            rng.choice(users),
+            rng.choice(STATUSES),
+        )
+
+
+async def seed(args: argparse.Namespace) -> None:
+    from sqlalchemy import text
+    from app.dependencies.db import async_session_maker, engine
+    from app.dependencies.hashing import hash_password
+    from app.dependencies.job_stats import rebuild_job_stats
+
+    rng = random.Random(SEED)
+    users = [f"bench{i}" for i in range(args.users)]
+    # one hash for everyone: seeding should not spend minutes in argon2
+    hashed = await hash_password(BENCH_PASSWORD)
+    now = datetime.utcnow()
+
+    start = time.perf_counter()
+    async with engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        async with raw.transaction():
+            await raw.execute("TRUNCATE jobs, job_stats, job_tombstones, idempotency_keys, users")
+            await raw.copy_records_to_table(
+                "users",
+                columns=[
+                    "created_at", "updated_at", "id", "full_name", "email", "username",
+                    "hashed_password",
+                ],
+                records=[
+                    (now, now, uuid4(), "Bench User", f"{name}@example.com", name, hashed)
+                    for name in users
+                ],
+            )
+            rows = job_records(users, args.jobs, rng)
+            while chunk := [row for _, row in zip(range(COPY_CHUNK_SIZE), rows)]:
+                await raw.copy_records_to_table(
+                    "jobs",
+                    columns=[
+                        "created_at", "updated_at", "id", "company", "position",
+                        "createdBy", "status",
+                    ],
+                    records=chunk,
+                )
+    async with async_session_maker() as session:
+        await rebuild_job_stats(session)
+    async with engine.connect() as conn:
+        await conn.execute(text("ANALYZE"))
+        await conn.commit()
+    print(
+        f"Seeded {args.users} users and {args.jobs} jobs "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+
+class Context:
+    """Tokens and job ids shared by the scenarios of one run."""
+
+    def __init__(
+        self,
+        users: list[str],
+        tokens: dict[str, str],
+        jobs: dict[str, list],
+        trigram: bool = True,
+    ):
+        self.users = users
+        self.tokens = tokens
+        self.jobs = jobs
+        # pg_trgm installed, so misspelt searches can take the trigram fallback
+        self.trigram = trigram
+        self.created: list[tuple[str, str]] = []
+        self.bulk_created: list[tuple[str, list[str]]] = []
+        # latest delta-sync token per Authorization header
+        self.sync_tokens: dict[str, str] = {}
+        self.run_id = "".join(random.choice("abcdefghij") for _ in range(6))
+
+    def user(self, i: int) -> str:
+        return self.users[i % len(self.users)]
+
+    def auth(self, username: str) -> dict:
+        return {"Authorization": f"Bearer {self.tokens[username]}"}
+
+
+class Scenario(NamedTuple):
+    method: str
+    path: str
+    # request kwargs for the i-th request, or None when nothing is left to send
+    build: Callable[[int, Context], dict | None]
+    record: Callable[[Any, Context], None] | None = None
+    # share of --requests to send, for routes that move a lot of data
+    weight: float = 1.0
+    # long-lived response: timed to its first chunk, then disconnected
+    stream: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+def job_payload(i: int) -> dict:
+    rng = random.Random(i)
+    return {"company": company_name(rng), "position": rng.choice(POSITIONS)}
+
+
+def list_params(i: int) -> dict:
+    variants = (
+        {},
+        {"status": STATUSES[i % 3]},
+        {"company": WORDS[i % len(WORDS)]},
+        {"order": "desc", "fields": "id,company,status"},
+    )
+    return variants[i % len(variants)]
+
+
+def create_job(i, ctx):
+    username = ctx.user(i)
+    return {"headers": ctx.auth(username), "json": job_payload(i)}
+
+
+def record_created(response, ctx):
+    ctx.created.append((response.json()["createdBy"], response.json()["id"]))
+
+
+def create_jobs(i, ctx):
+    return {
+        "headers": ctx.auth(ctx.user(i)),
+        "json": [job_payload(i * 10 + n) for n in range(10)],
+    }
+
+
+def record_bulk_created(response, ctx):
+    jobs = response.json()
+    ctx.bulk_created.append((jobs[0]["createdBy"], [job["id"] for job in jobs]))
+
+
+def update_jobs(i, ctx):
+    if not ctx.bulk_created:
+        return None
+    username, ids = ctx.bulk_created[i % len(ctx.bulk_created)]
+    return {
+        "headers": ctx.auth(username),
+        "json": {"where": {"ids": ids}, "status": STATUSES[i % 3]},
+    }
+
+
+def delete_jobs(i, ctx):
+    if not ctx.bulk_created:
+        return None
+    username, ids = ctx.bulk_created.pop()
+    return {"headers": ctx.auth(username), "json": {"ids": ids}}
+
+
+def update_job(i, ctx):
+    username = ctx.user(i)
+    job_ids = ctx.jobs[username]
+    return {
+        "path": {"job_id": job_ids[i % len(job_ids)]},
+        "headers": ctx.auth(username),
+        "json": {"status": STATUSES[i % 3]},
+    }
+
+
+def delete_job(i, ctx):
+    if not ctx.created:
+        return None
+    username, job_id = ctx.created.pop()
+    return {"path": {"job_id": job_id}, "headers": ctx.auth(username)}
+
+
+def read_job(i, ctx):
+    job_ids = ctx.jobs[ctx.user(i)]
+    return {"path": {"job_id": job_ids[i % len(job_ids)]}}
+
+
+def user_jobs(i, ctx):
+    return {"headers": ctx.auth(ctx.user(i)), "params": list_params(i)}
+
+
+def user_only(i, ctx):
+    return {"headers": ctx.auth(ctx.user(i))}
+
+
+def user_changes(i, ctx):
+    """Alternate full syncs with syncs from the token of an earlier response."""
+    request = user_only(i, ctx)
+    token = ctx.sync_tokens.get(request["headers"]["Authorization"])
+    if i % 2 and token is not None:
+        request["params"] = {"since": token}
+    return request
+
+
+def record_sync_token(response, ctx):
+    ctx.sync_tokens[response.request.headers["Authorization"]] = response.json()["next_token"]
+
+
+def search(i, ctx):
+    queries = (WORDS[i % len(WORDS)], POSITIONS[i % len(POSITIONS)].split()[0][:4])
+    if ctx.trigram:
+        # no full-text match, so this one takes the trigram fallback
+        queries += ("Acmr",)
+    return {"params": {"q": queries[i % len(queries)], "limit": 20}}
+
+
+def export(i, ctx):
+    return {
+        "params": {"status": STATUSES[i % 3], "company": WORDS[i % len(WORDS)], "format": "csv"}
+    }
+
+
+def register(i, ctx):
+    name = f"load{ctx.run_id}{i}"
+    return {
+        "json": {
+            "full_name": "Load Test",
+            "email": f"{name}@example.com",
+            "username": name,
+            "password": BENCH_PASSWORD,
+        }
+    }
+
+
+def login(i, ctx):
+    return {"data": {"username": ctx.user(i), "password": BENCH_PASSWORD}}
+
+
+def update_user(i, ctx):
+    return {"headers": ctx.auth(ctx.user(i)), "json": {"full_name": f"Bench {WORDS[i % 30]}"}}
+
+
+# reads first; writes then consume what earlier writes created
+SCENARIOS = (
+    Scenario("GET", "/jobs/jobs/", lambda i, ctx: {"params": list_params(i)}),
+    Scenario("GET", "/jobs/jobs/{job_id}", read_job),
+    Scenario("GET", "/jobs/jobs/user", user_jobs),
+    Scenario("GET", "/jobs/jobs/stats", user_only),
+    Scenario("GET", "/jobs/jobs/search", search),
+    Scenario("GET", "/jobs/jobs/export", export, weight=0.1),
+    Scenario("GET", "/jobs/jobs/user/export", user_only, weight=0.1),
+    Scenario("GET", "/jobs/jobs/user/changes", user_changes, record_sync_token),
+    Scenario("GET", "/jobs/jobs/user/stream", user_only, weight=0.2, stream=True),
+    Scenario("POST", "/jobs/jobs/", create_job, record_created),
+    Scenario("PATCH", "/jobs/jobs/{job_id}", update_job),
+    Scenario("DELETE", "/jobs/jobs/{job_id}", delete_job),
+    Scenario("POST", "/jobs/jobs/bulk", create_jobs, record_bulk_created, weight=0.2),
+    Scenario("PATCH", "/jobs/jobs/bulk", update_jobs, weight=0.2),
+    Scenario("DELETE", "/jobs/jobs/bulk", delete_jobs, weight=0.2),
+    Scenario("GET", "/user/users/", user_only),
+    Scenario("PATCH", "/user/users/", update_user),
+    Scenario("POST", "/user/users/", register, weight=0.2),
+    Scenario("POST", "/user/users/login/", login, weight=0.2),
+)
+
+
+def check_coverage() -> None:
+    """Fail when a job or user route has no scenario."""
+    from app.main import app
+    from app.routers import job_router, user_router
+
+    benchmarked = {scenario.name for scenario in SCENARIOS}
+    routes = {
+        route.endpoint
+        for module in (job_router, user_router)
+        for route in module.router.routes
+    }
+    missing = sorted(
+        f"{method} {route.path}"
+        for route in app.routes
+        if getattr(route, "endpoint", None) in routes
+        for method in route.methods
+        if f"{method} {route.path}" not in benchmarked
+    )
+    if missing:
+        raise SystemExit(f"Routes without a benchmark scenario: {', '.join(missing)}")
+
+
+async def prepare_context(args: argparse.Namespace, client, trigram: bool) -> Context:
+    from sqlalchemy import text
+    from app.dependencies.db import engine
+
+    users = [f"bench{i}" for i in range(min(args.users, 50))]
+    tokens = {}
+    for username in users:
+        response = await client.post(
+            "/user/users/login/", data={"username": username, "password": BENCH_PASSWORD}
+        )
+        response.raise_for_status()
+        tokens[username] = response.json()["access_token"]
+
+    async with engine.connect() as conn:
+        rows = await conn.execute(
+            text(
+                'SELECT "createdBy", id FROM ('
+                ' SELECT "createdBy", id,'
+                ' row_number() OVER (PARTITION BY "createdBy" ORDER BY id) AS n'
+                ' FROM jobs WHERE "createdBy" = ANY(:users)) ranked WHERE n <= 20'
+            ),
+            {"users": users},
+        )
+        jobs: dict[str, list] = {}
+        for username, job_id in rows:
+            jobs.setdefault(username, []).append(str(job_id))
+    # users that drew no seeded jobs cannot serve job-id scenarios
+    users = [username for username in users if username in jobs]
+    return Context(users, tokens, jobs, trigram)
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    if len(latencies) < 2:
+        cuts = [latencies[0] if latencies else 0.0] * 99
+    else:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": cuts[49] * 1000,
+        "p95_ms": cuts[94] * 1000,
+        "p99_ms": cuts[98] * 1000,
+        "max_ms": max(latencies, default=0.0) * 1000,
+    }
+
+
+async def asgi_first_chunk(app, method: str, url: str, headers: dict) -> int:
+    """Call `app` directly until the first body chunk, then disconnect.
+
+    httpx's ASGI transport only returns once the response is complete,
+    which a live stream never is.
+    """
+    path, _, query = url.partition("?")
+    first_chunk = asyncio.Event()
+    status_code = 500
+    request_sent = False
+
+    async def receive() -> dict:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await first_chunk.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            first_chunk.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    await app(scope, receive, send)
+    return status_code
+
+
+async def first_chunk_status(client, app, method: str, url: str, request: dict) -> int:
+    """Status of a streaming route once its first chunk has arrived."""
+    if app is not None:
+        return await asgi_first_chunk(app, method, url, request.get("headers", {}))
+    async with client.stream(method, url, **request) as response:
+        async for _ in response.aiter_raw():
+            break
+        return response.status_code
+
+
+async def run_scenario(client, scenario: Scenario, ctx: Context, args, app=None) -> dict:
+    count = max(int(args.requests * scenario.weight), 2)
+    pending = iter(range(count))
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in pending:
+            request = scenario.build(i, ctx)
+            if request is None:
+                # an earlier write failed, so there is nothing to act on
+                errors += 1
+                continue
+            url = scenario.path.format(**request.pop("path", {}))
+            start = time.perf_counter()
+            if scenario.stream:
+                status_code = await first_chunk_status(
+                    client, app, scenario.method, url, request
+                )
+                latencies.append(time.perf_counter() - start)
+                errors += status_code >= 400
+                continue
+            response = await client.request(scenario.method, url, **request)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+            elif scenario.record is not None:
+                scenario.record(response, ctx)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+async def benchmark(args: argparse.Namespace, trigram: bool) -> dict:
+    import httpx
+    from app.dependencies.db import engine, read_engine
+    from app.dependencies.job_events import job_events
+    from app.main import app
+
+    if not args.skip_seed:
+        await seed(args)
+
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+    else:
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60
+        )
+    results = {}
+    try:
+        async with client:
+            ctx = await prepare_context(args, client, trigram)
+            for scenario in SCENARIOS:
+                summary = await run_scenario(
+                    client, scenario, ctx, args, app=None if args.base_url else app
+                )
+                results[scenario.name] = summary
+                print(
+                    f"{scenario.name:<28} {summary['rps']:>9.1f} rps "
+                    f"p50 {summary['p50_ms']:>8.2f} ms  p95 {summary['p95_ms']:>8.2f} ms  "
+                    f"p99 {summary['p99_ms']:>8.2f} ms  errors {summary['errors']}"
+                )
+    finally:
+        # the lifespan does not run under the ASGI transport
+        await job_events.stop()
+        await engine.dispose()
+        await read_engine.dispose()
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Regressions of `results` against `baseline`, as readable lines."""
+    failures = []
+    if baseline["meta"].get("trigram", True) and not results["meta"]["trigram"]:
+        failures.append("GET /jobs/jobs/search: trigram fallback not benchmarked (no pg_trgm)")
+    for name, base in baseline["routes"].items():
+        current = results["routes"].get(name)
+        if current is None:
+            failures.append(f"{name}: not benchmarked")
+            continue
+        for metric in ("p95_ms", "p99_ms"):
+            if current[metric] > base[metric] * (1 + threshold):
+                failures.append(
+                    f"{name}: {metric} {current[metric]:.2f} > baseline {base[metric]:.2f}"
+                )
+        if current["rps"] < base["rps"] * (1 - threshold):
+            failures.append(f"{name}: rps {current['rps']:.1f} < baseline {base['rps']:.1f}")
+    return failures
+
+
+def main() -> None:
+    args = parse_args()
+    url, server = start_database(args)
+    os.environ["POSTGRES_CONN_STR"] = url
+    os.environ.pop("POSTGRES_REPLICA_CONN_STR", None)
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret")
+    os.environ.setdefault("ALGORITHM", "HS256")
+    try:
+        trigram = asyncio.run(trigram_installable(url))
+        migrate(trigram)
+        check_coverage()
+        routes = asyncio.run(benchmark(args, trigram))
+    finally:
+        if server is not None:
+            server.cleanup()
+
+    results = {
+        "meta": {
+            "users": args.users,
+            "jobs": args.jobs,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "transport": args.base_url or "asgi",
+            "python": platform.python_version(),
+            # false: search ran without its misspelt (trigram fallback) queries
+            "trigram": trigram,
+            "timestamp": datetime.utcnow().isoformat(),
+        },
+        "routes": routes,
+    }
+    for path in filter(None, (args.output, args.save_baseline)):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Wrote {path}")
+
+    failures = [
+        f"{name}: {summary['errors']} errors"
+        for name, summary in routes.items()
+        if summary["errors"]
+    ]
+    if args.baseline:
+        failures += compare(results, json.loads(Path(args.baseline).read_text()), args.threshold)
+    if failures:
+        print("Benchmark regressions:", *failures, sep="\n  ", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
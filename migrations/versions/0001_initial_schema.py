@@ -0,0 +1,101 @@
+"""initial schema: users, jobs, job_stats
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+job_status = sa.Enum("interviewed", "declined", "pending", name="jobstatus")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_table(
+        "users",
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("full_name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "jobs",
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("company", sa.String(), nullable=False),
+        sa.Column("position", sa.String(), nullable=False),
+        sa.Column("createdBy", sa.String(), nullable=False),
+        sa.Column("status", job_status, nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_jobs_created_at_id", "jobs", ["created_at", "id"])
+    op.create_index(
+        "ix_jobs_createdBy_created_at_id", "jobs", ["createdBy", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_jobs_status_created_at_id", "jobs", ["status", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_jobs_createdBy_status_created_at",
+        "jobs",
+        ["createdBy", "status", "created_at", "id"],
+    )
+    op.create_index("ix_jobs_createdBy_updated_at", "jobs", ["createdBy", "updated_at"])
+    op.create_index(
+        "ix_jobs_company_prefix",
+        "jobs",
+        ["company"],
+        postgresql_ops={"company": "varchar_pattern_ops"},
+    )
+    op.create_index(
+        "ix_jobs_position_prefix",
+        "jobs",
+        ["position"],
+        postgresql_ops={"position": "varchar_pattern_ops"},
+    )
+    op.create_index(
+        "ix_jobs_search",
+        "jobs",
+        [sa.text("to_tsvector('simple', company || ' ' || position)")],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_jobs_company_trgm",
+        "jobs",
+        ["company"],
+        postgresql_using="gin",
+        postgresql_ops={"company": "gin_trgm_ops"},
+    )
+
+    op.create_table(
+        "job_stats",
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("pending", sa.Integer(), nullable=False),
+        sa.Column("interviewed", sa.Integer(), nullable=False),
+        sa.Column("declined", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("username"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("job_stats")
+    op.drop_table("jobs")
+    job_status.drop(op.get_bind(), checkfirst=True)
+    op.drop_table("users")
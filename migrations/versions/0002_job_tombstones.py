@@ -0,0 +1,34 @@
+"""job_tombstones for delta sync
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_tombstones",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("createdBy", sa.String(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_job_tombstones_createdBy_deleted_at_id",
+        "job_tombstones",
+        ["createdBy", "deleted_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("job_tombstones")
@@ -0,0 +1,54 @@
+"""publish job change events from statement-level triggers
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# one event per user and statement, split so a payload stays under NOTIFY's
+# 8000 byte limit (150 quoted UUIDs)
+NOTIFY_FUNCTION = """
+CREATE FUNCTION notify_job_changes() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    EXECUTE format(
+        'SELECT pg_notify(''job_changes'', json_build_object('
+        '''op'', %L, ''user'', "createdBy", ''ids'', json_agg(id))::text) '
+        'FROM (SELECT "createdBy", id, '
+        '(row_number() OVER (PARTITION BY "createdBy" ORDER BY id) - 1) / 150 AS chunk '
+        'FROM %I) AS changed GROUP BY "createdBy", chunk',
+        CASE TG_OP WHEN 'INSERT' THEN 'created' WHEN 'UPDATE' THEN 'updated' ELSE 'deleted' END,
+        CASE TG_OP WHEN 'DELETE' THEN 'old_rows' ELSE 'new_rows' END
+    );
+    RETURN NULL;
+END
+$$
+"""
+
+TRIGGERS = (
+    ("jobs_notify_insert", "INSERT", "NEW TABLE AS new_rows"),
+    ("jobs_notify_update", "UPDATE", "NEW TABLE AS new_rows"),
+    ("jobs_notify_delete", "DELETE", "OLD TABLE AS old_rows"),
+)
+
+
+def upgrade() -> None:
+    op.execute(NOTIFY_FUNCTION)
+    for name, event, transition in TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} ON jobs REFERENCING {transition} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION notify_job_changes()"
+        )
+
+
+def downgrade() -> None:
+    for name, _, _ in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON jobs")
+    op.execute("DROP FUNCTION IF EXISTS notify_job_changes()")
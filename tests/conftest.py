@@ -0,0 +1,4 @@
+import os
+
+# app.dependencies.db builds its engines at import time; nothing here connects
+os.environ.setdefault("POSTGRES_CONN_STR", "postgresql+asyncpg://localhost/job_api_test")
@@ -0,0 +1,99 @@
+from app.dependencies.cache import LRUCache
+import asyncio
+
+
+def test_entry_expires_after_its_ttl():
+    cache = LRUCache(maxsize=10, ttl=60)
+
+    async def scenario():
+        await cache.set("fresh", 1)
+        await cache.set("stale", 2, ttl=0)
+        return await cache.get("fresh"), await cache.get("stale")
+
+    assert asyncio.run(scenario()) == (1, None)
+    assert cache.expirations == 1
+    assert cache.stats()["size"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(maxsize=2, ttl=60)
+
+    async def scenario():
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+        return [await cache.get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(scenario()) == [1, None, 3]
+    assert cache.evictions == 1
+    assert cache.stats()["size"] == 2
+
+
+def test_invalidate_tag_drops_only_tagged_entries():
+    cache = LRUCache(maxsize=10, ttl=60)
+
+    async def scenario():
+        await cache.set("list", 1, tags=("jobs",))
+        await cache.set("other", 2)
+        await cache.invalidate_tag("jobs")
+        return await cache.get("list"), await cache.get("other")
+
+    assert asyncio.run(scenario()) == (None, 2)
+    assert cache.invalidations == 1
+
+
+def test_get_or_load_stores_and_reuses_the_loaded_value():
+    cache = LRUCache(maxsize=10, ttl=60)
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return "value"
+
+    async def scenario():
+        return [await cache.get_or_load("key", loader) for _ in range(2)]
+
+    assert asyncio.run(scenario()) == ["value", "value"]
+    assert len(loads) == 1
+
+
+def test_load_overlapping_an_invalidation_is_not_stored():
+    cache = LRUCache(maxsize=10, ttl=60)
+    loading = asyncio.Event()
+    invalidated = asyncio.Event()
+
+    async def slow_loader():
+        # read before the write, returned after its invalidation
+        loading.set()
+        await invalidated.wait()
+        return "before write"
+
+    async def writer():
+        await loading.wait()
+        await cache.invalidate_tag("jobs")
+        invalidated.set()
+
+    async def scenario():
+        value, _ = await asyncio.gather(
+            cache.get_or_load("key", slow_loader, tags=("jobs",)), writer()
+        )
+        return value, await cache.get("key")
+
+    assert asyncio.run(scenario()) == ("before write", None)
+
+
+def test_none_is_never_cached():
+    cache = LRUCache(maxsize=10, ttl=60)
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return None
+
+    async def scenario():
+        for _ in range(2):
+            await cache.get_or_load("missing", loader)
+
+    asyncio.run(scenario())
+    assert len(loads) == 2
@@ -0,0 +1,111 @@
+from fastapi import HTTPException, Response
+from pydantic import BaseModel
+from app.dependencies import idempotency
+from app.dependencies.idempotency import IdempotentRequests, MemoryIdempotencyStore
+import asyncio
+import json
+import pytest
+
+
+class Payload(BaseModel):
+    company: str
+
+
+class Action:
+    """Stands in for a route handler; counts calls and can wait or fail."""
+
+    def __init__(self, delay=0.0, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return {"company": "Acme", "call": self.calls}
+
+
+def new_requests() -> IdempotentRequests:
+    return IdempotentRequests(MemoryIdempotencyStore(100))
+
+
+def test_retry_replays_the_stored_body():
+    requests, action = new_requests(), Action()
+
+    async def scenario():
+        first = await requests.run("alice:key", Payload(company="Acme"), 201, action)
+        retry = await requests.run("alice:key", Payload(company="Acme"), 201, action)
+        return first, retry
+
+    first, retry = asyncio.run(scenario())
+    assert action.calls == 1
+    assert isinstance(retry, Response)
+    assert retry.status_code == 201
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert json.loads(retry.body) == first == {"company": "Acme", "call": 1}
+    assert requests.replays == 1
+
+
+def test_key_reused_with_another_body_is_rejected():
+    requests, action = new_requests(), Action()
+
+    async def scenario():
+        await requests.run("alice:key", Payload(company="Acme"), 201, action)
+        await requests.run("alice:key", Payload(company="Beta"), 201, action)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(scenario())
+    assert error.value.status_code == 422
+    assert action.calls == 1
+    assert requests.mismatches == 1
+
+
+def test_concurrent_duplicate_waits_for_the_first_request():
+    requests, action = new_requests(), Action(delay=0.05)
+
+    async def scenario():
+        return await asyncio.gather(
+            requests.run("alice:key", Payload(company="Acme"), 201, action),
+            requests.run("alice:key", Payload(company="Acme"), 201, action),
+        )
+
+    first, duplicate = asyncio.run(scenario())
+    assert action.calls == 1
+    assert requests.waits == 1
+    assert json.loads(duplicate.body) == first
+
+
+def test_failed_action_releases_its_key():
+    requests, failing = new_requests(), Action(error=ValueError("insert failed"))
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await requests.run("alice:key", Payload(company="Acme"), 201, failing)
+        return await requests.run("alice:key", Payload(company="Acme"), 201, Action())
+
+    assert asyncio.run(scenario()) == {"company": "Acme", "call": 1}
+    assert requests.executions == 2
+    assert requests.replays == 0
+
+
+def test_duplicate_gives_up_with_409_after_the_wait(monkeypatch):
+    monkeypatch.setattr(idempotency, "IDEMPOTENCY_WAIT_SECONDS", 0.02)
+    requests, action = new_requests(), Action(delay=0.2)
+
+    async def scenario():
+        first = asyncio.ensure_future(
+            requests.run("alice:key", Payload(company="Acme"), 201, action)
+        )
+        await asyncio.sleep(0)
+        try:
+            await requests.run("alice:key", Payload(company="Acme"), 201, action)
+        finally:
+            await first
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(scenario())
+    assert error.value.status_code == 409
+    assert action.calls == 1
+    assert requests.timeouts == 1
@@ -0,0 +1,164 @@
+from contextlib import asynccontextmanager
+from app.dependencies.job_batching import JobInsertCoalescer
+from app.models.job_model import Job
+import asyncio
+import pytest
+
+
+class FakeResult:
+    def __init__(self, jobs: list[Job]):
+        self.jobs = jobs
+
+    def all(self) -> list[Job]:
+        return self.jobs
+
+    def one(self) -> Job:
+        (job,) = self.jobs
+        return job
+
+
+class FakeDatabase:
+    """Stands in for async_session_maker; records what the coalescer writes."""
+
+    def __init__(self, failing=(), insert_delay=0.0, rollback_error=None):
+        self.failing = set(failing)
+        self.insert_delay = insert_delay
+        self.rollback_error = rollback_error
+        self.inserts: list[int] = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def __call__(self) -> "FakeSession":
+        return FakeSession(self)
+
+
+class FakeSession:
+    def __init__(self, db: FakeDatabase):
+        self.db = db
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def scalars(self, statement, rows: list[dict]) -> FakeResult:
+        self.db.inserts.append(len(rows))
+        await asyncio.sleep(self.db.insert_delay)
+        if any(row["company"] in self.db.failing for row in rows):
+            raise ValueError("duplicate key")
+        return FakeResult([Job(**row) for row in rows])
+
+    async def execute(self, statement, params=None) -> None:
+        pass
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+    async def commit(self) -> None:
+        self.db.commits += 1
+
+    async def rollback(self) -> None:
+        self.db.rollbacks += 1
+        if self.db.rollback_error is not None:
+            raise self.db.rollback_error
+
+
+def job_row(company: str) -> dict:
+    return Job(company=company, position="Engineer", createdBy="alice").model_dump()
+
+
+def submit_all(coalescer: JobInsertCoalescer, companies: list[str]):
+    return asyncio.gather(
+        *(coalescer.submit(job_row(company)) for company in companies),
+        return_exceptions=True,
+    )
+
+
+def test_concurrent_submissions_share_one_insert_and_commit():
+    db = FakeDatabase()
+
+    async def scenario():
+        coalescer = JobInsertCoalescer(0.01, 100, session_maker=db)
+        return await submit_all(coalescer, [f"Company {n}" for n in range(20)])
+
+    jobs = asyncio.run(scenario())
+    assert db.inserts == [20]
+    assert db.commits == 1
+    assert [job.company for job in jobs] == [f"Company {n}" for n in range(20)]
+
+
+def test_full_batch_is_written_without_waiting_for_the_window():
+    db = FakeDatabase()
+
+    async def scenario():
+        coalescer = JobInsertCoalescer(60, 2, session_maker=db)
+        return await asyncio.wait_for(submit_all(coalescer, ["Acme", "Beta"]), 1)
+
+    jobs = asyncio.run(scenario())
+    assert db.inserts == [2]
+    assert all(isinstance(job, Job) for job in jobs)
+
+
+def test_failing_row_only_fails_its_own_request():
+    db = FakeDatabase(failing={"Broken"})
+
+    async def scenario():
+        coalescer = JobInsertCoalescer(0.01, 100, session_maker=db)
+        return await submit_all(coalescer, ["Acme", "Broken", "Beta"])
+
+    acme, broken, beta = asyncio.run(scenario())
+    # one batch INSERT, then one savepoint INSERT per row
+    assert db.inserts == [3, 1, 1, 1]
+    assert db.commits == 1
+    assert (acme.company, beta.company) == ("Acme", "Beta")
+    assert isinstance(broken, ValueError)
+
+
+def test_failed_rollback_fails_every_request_instead_of_hanging():
+    db = FakeDatabase(failing={"Broken"}, rollback_error=ConnectionError("connection lost"))
+
+    async def scenario():
+        coalescer = JobInsertCoalescer(0.01, 100, session_maker=db)
+        return await asyncio.wait_for(submit_all(coalescer, ["Acme", "Broken"]), 1)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert db.commits == 0
+
+
+@pytest.mark.parametrize("started", [False, True])
+def test_cancelled_write_fails_every_request_instead_of_hanging(started):
+    db = FakeDatabase(insert_delay=60)
+
+    async def scenario():
+        coalescer = JobInsertCoalescer(0.001, 100, session_maker=db)
+        waiting = submit_all(coalescer, ["Acme", "Beta"])
+        while not (db.inserts if started else coalescer._writes):
+            await asyncio.sleep(0.001)
+        for task in coalescer._writes:
+            task.cancel()
+        return await asyncio.wait_for(waiting, 1)
+
+    results = asyncio.run(scenario())
+    assert db.inserts == ([2] if started else [])
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert "not written" in str(results[0])
+
+
+@pytest.mark.parametrize("window", [0.001, 0.01])
+def test_cancelled_request_does_not_disturb_the_rest_of_its_batch(window):
+    db = FakeDatabase(insert_delay=0.01)
+
+    async def scenario():
+        coalescer = JobInsertCoalescer(window, 100, session_maker=db)
+        first = asyncio.ensure_future(coalescer.submit(job_row("Acme")))
+        second = asyncio.ensure_future(coalescer.submit(job_row("Beta")))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    first, second = asyncio.run(scenario())
+    assert isinstance(first, asyncio.CancelledError)
+    assert second.company == "Beta"